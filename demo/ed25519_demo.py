@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Demo of Ed25519 signature verification using RISC Zero zkVM"""
 
+import mmap
 import os
+import struct
 import sys
 import time
 from pathlib import Path
@@ -20,6 +22,12 @@ VALID_SIG = "e5564300c360ac729086e2cc806e828a84877f1eb8e5d974d873e065224901555fb
 INVALID_SIG = "3b41da0837e8f4e7b1ba8d9e0db233a22a5764c84e8870c049e7e210c512a4532dbab6222d5e98dd50fe0fb186c039fe9a0387bf43de1fbf655c101db2540b06"
 MESSAGE = ""
 
+# Decode the fixed test inputs once
+PK_BYTES = bytes.fromhex(PUBLIC_KEY)
+VALID_SIG_BYTES = bytes.fromhex(VALID_SIG)
+INVALID_SIG_BYTES = bytes.fromhex(INVALID_SIG)
+MSG_BYTES = MESSAGE.encode('utf-8')
+
 # Build and load the guest program using the new API
 print("\nBuilding guest program...")
 try:
@@ -27,10 +35,10 @@ try:
     elf_path = pyr0.build_guest(GUEST_DIR)
     print(f"✓ Guest built at: {elf_path}")
     
-    # Load the ELF
+    # Load the ELF straight from a read-only mapping (no bytes copy)
     with open(elf_path, "rb") as f:
-        elf_data = f.read()
-    image = pyr0.load_image(elf_data)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as elf_data:
+            image = pyr0.load_image(elf_data)
     print("✓ ELF loaded into image")
 except pyr0.GuestBuildFailedError as e:
     print(f"❌ Build failed: {e}")
@@ -49,13 +57,9 @@ print(f"  (Full ID: {PROGRAM_ID})")
 
 # Test with valid signature
 print("\n=== Test 1: Valid Signature ===")
-pk_bytes = bytes.fromhex(PUBLIC_KEY)
-sig_bytes = bytes.fromhex(VALID_SIG)
-msg_bytes = MESSAGE.encode('utf-8')
-
 # Use the new API - prove() accepts bytes directly
 # The serialization helper creates the proper format for the guest
-input_data = serialization.ed25519_input(pk_bytes, sig_bytes, msg_bytes)
+input_data = serialization.ed25519_input_arrays(PK_BYTES, VALID_SIG_BYTES, MSG_BYTES)
 
 print(f"Input size: {len(input_data)} bytes")
 print("Executing and generating proof...")
@@ -73,22 +77,21 @@ if len(journal) < 4:
     sys.exit(1)
 
 # Read result status (first u8 committed, stored as 4-byte word)
-import struct
-result = struct.unpack('<I', journal[0:4])[0]
+result, = struct.unpack_from('<I', journal, 0)
 
 if result == 1:
     print("✅ Signature VALID - Test PASSED")
-    # When valid, guest also commits the public key
-    if len(journal) >= 36:  # 4 bytes for result + 32 bytes for public key
-        public_key = journal[4:36]
+    # When valid, guest also commits the public key as a Vec<u8>:
+    # a length word followed by one u32 word per byte
+    if len(journal) >= 8:
+        key_len, = struct.unpack_from('<I', journal, 4)
+        public_key = journal[8:8 + 4 * key_len:4]
         print(f"Public key in journal: {public_key.hex()[:16]}...")
 elif result == 0:
     print("❌ Signature INVALID - Test FAILED")
     if len(journal) >= 8:  # Has error reason
-        reason = struct.unpack('<I', journal[4:8])[0]
-        if reason == 1:
-            print("   Reason: Size error (invalid key or signature length)")
-        elif reason == 2:
+        reason, = struct.unpack_from('<I', journal, 4)
+        if reason == 2:
             print("   Reason: Invalid public key format")
         elif reason == 3:
             print("   Reason: Signature verification failed")
@@ -115,9 +118,7 @@ print("✓ Proof verified")
 
 # Test with invalid signature
 print("\n=== Test 2: Invalid Signature ===")
-sig_bytes = bytes.fromhex(INVALID_SIG)
-
-input_data = serialization.ed25519_input(pk_bytes, sig_bytes, msg_bytes)
+input_data = serialization.ed25519_input_arrays(PK_BYTES, INVALID_SIG_BYTES, MSG_BYTES)
 
 # Generate proof for invalid signature test
 print("Generating proof for invalid signature...")
@@ -130,13 +131,12 @@ if len(journal) < 4:
     print(f"❌ ERROR: Journal too short ({len(journal)} bytes) - guest crashed!")
     sys.exit(1)
 
-import struct
-result = struct.unpack('<I', journal[0:4])[0]
+result, = struct.unpack_from('<I', journal, 0)
 test_passed = False
 if result == 0:
     print("✅ Signature correctly reported as INVALID - Test PASSED")
     if len(journal) >= 8:
-        reason = struct.unpack('<I', journal[4:8])[0]
+        reason, = struct.unpack_from('<I', journal, 4)
         if reason == 3:
             print("   Reason: Signature verification failed (as expected)")
     test_passed = True
@@ -2,25 +2,17 @@ use risc0_zkvm::guest::env;
 use ed25519_dalek::{Signature, Verifier, VerifyingKey};
 
 fn main() {
-    // Read input from host - env::read() will panic if deserialization fails
-    let public_key_vec: Vec<u8> = env::read();
-    let signature_vec: Vec<u8> = env::read();
-    let message: Vec<u8> = env::read();
-    
-    // Validate input sizes
-    if public_key_vec.len() != 32 || signature_vec.len() != 64 {
-        // Commit error status and reason
-        env::commit(&0u8);  // 0 = invalid
-        env::commit(&1u8);  // reason: 1 = size error
-        return;
-    }
-    
-    // Convert to arrays
+    // Key and signature arrive as raw fixed-size arrays (read_slice), so
+    // each byte occupies one byte of input instead of a whole u32 word as
+    // it would through env::read(). The message length is not known in
+    // advance, so it is still read as a serde Vec<u8>.
     let mut public_key_bytes = [0u8; 32];
-    public_key_bytes.copy_from_slice(&public_key_vec);
+    env::read_slice(&mut public_key_bytes);
     
     let mut signature_bytes = [0u8; 64];
-    signature_bytes.copy_from_slice(&signature_vec);
+    env::read_slice(&mut signature_bytes);
+    
+    let message: Vec<u8> = env::read();
     
     // Create verifying key
     let verifying_key = match VerifyingKey::from_bytes(&public_key_bytes) {
@@ -0,0 +1,33 @@
+use pyo3::buffer::PyBuffer;
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+
+/// Copy a bytes-like Python object into an owned Vec<u8>.
+///
+/// `bytes` is copied straight from its internal storage and any other
+/// object exporting the buffer protocol (bytearray, memoryview, mmap,
+/// array.array, ...) is copied in one contiguous pass. Extracting a
+/// `Vec<u8>` directly would instead walk the object as a sequence and
+/// convert every element to a Python int first, which dominates the cost
+/// for multi-megabyte ELFs and inputs. Plain sequences of ints are still
+/// accepted through that slower path for backwards compatibility.
+pub(crate) fn extract_bytes(obj: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
+    if let Ok(bytes) = obj.downcast::<PyBytes>() {
+        return Ok(bytes.as_bytes().to_vec());
+    }
+    if let Ok(buffer) = PyBuffer::<u8>::get(obj) {
+        return buffer.to_vec(obj.py());
+    }
+    obj.extract()
+}
+
+/// Call `f` with the contents of a bytes-like Python object.
+///
+/// `bytes` is borrowed in place, so nothing is copied before `f` runs;
+/// every other object goes through `extract_bytes` first.
+pub(crate) fn with_bytes<R>(obj: &Bound<'_, PyAny>, f: impl FnOnce(&[u8]) -> R) -> PyResult<R> {
+    if let Ok(bytes) = obj.downcast::<PyBytes>() {
+        return Ok(f(bytes.as_bytes()));
+    }
+    Ok(f(&extract_bytes(obj)?))
+}
@@ -1,10 +1,12 @@
 use pyo3::prelude::*;
 use pyo3::exceptions::{PyValueError, PyRuntimeError};
+use pyo3::types::PyTuple;
 use risc0_zkvm::{ExecutorEnv, ProverOpts};
 use risc0_zkvm::sha::{Digestible, Sha256, Digest};
 use crate::image::Image;
 use crate::receipt::Receipt;
 use crate::input_builder::InputBuilder;
+use crate::buffer::{extract_bytes, with_bytes};
 use std::collections::{HashSet, HashMap};
 
 /// A builder for composing proofs with type-safe inputs and assumptions
@@ -36,7 +38,7 @@ impl Composer {
             image,
             assumptions: Vec::new(),
             assumption_digests: HashSet::new(),
-            input_builder: InputBuilder::new(),
+            input_builder: InputBuilder::new(None),
             expected_verifications: Vec::new(),
         }
     }
@@ -129,9 +131,8 @@ impl Composer {
     /// 
     /// Delegates to the internal InputBuilder.
     /// See InputBuilder.write_cbor() for full documentation.
-    pub fn write_cbor(&mut self, cbor_bytes: Vec<u8>) -> PyResult<()> {
-        self.input_builder.write_cbor_internal(cbor_bytes);
-        Ok(())
+    pub fn write_cbor(&mut self, cbor_bytes: &Bound<'_, PyAny>) -> PyResult<()> {
+        with_bytes(cbor_bytes, |bytes| self.input_builder.write_cbor_internal(bytes))
     }
     
     /// Write CBOR with length frame (Pattern C: Safe mixing)
@@ -141,9 +142,8 @@ impl Composer {
     /// 
     /// Delegates to the internal InputBuilder.
     /// See InputBuilder.write_cbor_frame() for full documentation.
-    pub fn write_cbor_frame(&mut self, cbor_bytes: Vec<u8>) -> PyResult<()> {
-        self.input_builder.write_cbor_frame_internal(cbor_bytes);
-        Ok(())
+    pub fn write_cbor_frame(&mut self, cbor_bytes: &Bound<'_, PyAny>) -> PyResult<()> {
+        with_bytes(cbor_bytes, |bytes| self.input_builder.write_cbor_frame_internal(bytes))
     }
     
     /// Write a u32 value (4 bytes, little-endian)
@@ -168,9 +168,8 @@ impl Composer {
     /// 
     /// Delegates to the internal InputBuilder.
     /// See InputBuilder.write_raw_bytes() for full documentation.
-    pub fn write_raw_bytes(&mut self, data: Vec<u8>) -> PyResult<()> {
-        self.input_builder.write_raw_bytes_internal(data);
-        Ok(())
+    pub fn write_raw_bytes(&mut self, data: &Bound<'_, PyAny>) -> PyResult<()> {
+        with_bytes(data, |bytes| self.input_builder.write_raw_bytes_internal(bytes))
     }
     
     /// Write raw bytes with length frame (Pattern C: Variable-length data)
@@ -179,9 +178,17 @@ impl Composer {
     /// 
     /// Delegates to the internal InputBuilder.
     /// See InputBuilder.write_frame() for full documentation.
-    pub fn write_frame(&mut self, data: Vec<u8>) -> PyResult<()> {
-        self.input_builder.write_frame_internal(data);
-        Ok(())
+    pub fn write_frame(&mut self, data: &Bound<'_, PyAny>) -> PyResult<()> {
+        with_bytes(data, |bytes| self.input_builder.write_frame_internal(bytes))
+    }
+    
+    /// Write several raw fields in one call from a struct-style format
+    /// 
+    /// Delegates to the internal InputBuilder.
+    /// See InputBuilder.write_packed() for full documentation.
+    #[pyo3(signature = (format, *values))]
+    pub fn write_packed(&mut self, format: &str, values: &Bound<'_, PyTuple>) -> PyResult<()> {
+        self.input_builder.write_packed_internal(format, values)
     }
     
     // Compatibility methods for specific use cases
@@ -195,14 +202,9 @@ impl Composer {
     /// let mut bytes = [0u8; 32];
     /// env::read_slice(&mut bytes);
     /// ```
-    pub fn write_bytes32(&mut self, data: Vec<u8>) -> PyResult<()> {
-        if data.len() != 32 {
-            return Err(PyErr::new::<PyValueError, _>(
-                format!("write_bytes32 requires exactly 32 bytes, got {}", data.len())
-            ));
-        }
-        self.input_builder.write_raw_bytes_internal(data);
-        Ok(())
+    pub fn write_bytes32(&mut self, data: &Bound<'_, PyAny>) -> PyResult<()> {
+        with_bytes(data, |bytes| self.input_builder.write_bytes32_internal(bytes))?
+            .map_err(PyValueError::new_err)
     }
     
     /// Write an image ID (alias for write_bytes32)
@@ -213,7 +215,7 @@ impl Composer {
     /// env::read_slice(&mut bytes);
     /// let image_id = Digest::from_bytes(bytes);
     /// ```
-    pub fn write_image_id(&mut self, image_id: Vec<u8>) -> PyResult<()> {
+    pub fn write_image_id(&mut self, image_id: &Bound<'_, PyAny>) -> PyResult<()> {
         self.write_bytes32(image_id)
     }
     
@@ -221,7 +223,9 @@ impl Composer {
     /// 
     /// This helps catch mismatches between what the guest will verify
     /// and what assumptions were added.
-    pub fn expect_verification(&mut self, image_id: Vec<u8>, journal: Vec<u8>) -> PyResult<()> {
+    pub fn expect_verification(&mut self, image_id: &Bound<'_, PyAny>, journal: &Bound<'_, PyAny>) -> PyResult<()> {
+        let image_id = extract_bytes(image_id)?;
+        let journal = extract_bytes(journal)?;
         if image_id.len() != 32 {
             return Err(PyErr::new::<PyValueError, _>(
                 format!("Image ID must be 32 bytes, got {}", image_id.len())
@@ -250,6 +254,11 @@ impl Composer {
     pub fn preflight_check(&self, raise_on_error: bool) -> PyResult<Vec<String>> {
         let mut issues = Vec::new();
         
+        // Nothing expected and nothing assumed: no claims to hash or compare
+        if self.assumptions.is_empty() && self.expected_verifications.is_empty() {
+            return Ok(issues);
+        }
+        
         // Build map of assumption claims (for better error messages)
         let mut assumption_claims = HashMap::new();
         for assumption in &self.assumptions {
@@ -340,6 +349,9 @@ impl Composer {
     
     /// Generate a proof with the configured assumptions and inputs
     /// 
+    /// The GIL is released while proving, so proofs from several Composers
+    /// can run on separate Python threads.
+    /// 
     /// Args:
     ///     kind: ReceiptKind enum value (default: ReceiptKind.SUCCINCT)
     ///           SUCCINCT resolves assumptions via the recursion program.
@@ -363,25 +375,11 @@ impl Composer {
             self.preflight_check(true)?;  // Will raise on issues
         }
         
-        // Build ExecutorEnv
-        let mut builder = ExecutorEnv::builder();
-        
-        // Add assumptions
-        for assumption in &self.assumptions {
-            builder.add_assumption(assumption.clone());
-        }
-        
-        // Add input data
-        let input_data = self.input_builder.build();
-        if !input_data.is_empty() {
-            builder.write_slice(&input_data);
-        }
-        
-        let env = builder.build()
-            .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("Failed to build environment: {}", e)))?;
-        
-        // Get the image
+        // Get the image and input data
         let image = self.image.borrow(py);
+        let elf = image.get_elf();
+        let input_data = self.input_builder.build();
+        let assumptions = &self.assumptions;
         
         // Determine proof kind (default to SUCCINCT)
         use crate::receipt::ReceiptKind;
@@ -418,22 +416,41 @@ impl Composer {
             )),
         };
         
-        // Generate proof
-        let receipt = risc0_zkvm::default_prover()
-            .prove_with_opts(env, image.get_elf(), &opts)
-            .map_err(|e| {
-                // Try to provide better error messages for composition failures
-                if e.to_string().contains("assumption") || e.to_string().contains("verify") {
-                    PyErr::new::<PyRuntimeError, _>(format!(
-                        "Proof generation failed - likely claim mismatch:\n{}\n\
-                         Check that env::verify() calls match the assumptions provided.",
-                        e
-                    ))
-                } else {
-                    PyErr::new::<PyRuntimeError, _>(format!("Proof generation failed: {}", e))
-                }
-            })?
-            .receipt;
+        // Building the environment and proving are pure Rust - release the
+        // GIL so other Python threads keep running
+        let receipt = py.allow_threads(|| -> PyResult<_> {
+            let mut builder = ExecutorEnv::builder();
+            
+            // Add assumptions
+            for assumption in assumptions {
+                builder.add_assumption(assumption.clone());
+            }
+            
+            // Add input data
+            if !input_data.is_empty() {
+                builder.write_slice(&input_data);
+            }
+            
+            let env = builder.build()
+                .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("Failed to build environment: {}", e)))?;
+            
+            // Generate proof
+            let info = risc0_zkvm::default_prover()
+                .prove_with_opts(env, elf, &opts)
+                .map_err(|e| {
+                    // Try to provide better error messages for composition failures
+                    if e.to_string().contains("assumption") || e.to_string().contains("verify") {
+                        PyErr::new::<PyRuntimeError, _>(format!(
+                            "Proof generation failed - likely claim mismatch:\n{}\n\
+                             Check that env::verify() calls match the assumptions provided.",
+                            e
+                        ))
+                    } else {
+                        PyErr::new::<PyRuntimeError, _>(format!("Proof generation failed: {}", e))
+                    }
+                })?;
+            Ok(info.receipt)
+        })?;
         
         Ok(Receipt::from_risc0(receipt))
     }
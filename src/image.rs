@@ -15,13 +15,17 @@ pub struct Image {
 }
 
 impl Image {
-    pub fn from_elf(elf: &[u8], image_id: Digest) -> Result<Self> {
-        let program = Program::load_elf(elf, GUEST_MAX_MEM as u32)?;
+    /// Takes the ELF by value so it is stored without another copy
+    pub fn from_elf(elf: Vec<u8>) -> Result<Self> {
+        let program = Program::load_elf(&elf, GUEST_MAX_MEM as u32)?;
         let image = MemoryImage::new(&program, PAGE_SIZE as u32)?;
+        // Derive the ID from the image we just built rather than calling
+        // compute_image_id, which would parse the ELF and page it in again
+        let image_id = image.compute_id()?;
         Ok(Self {
             memory_image: Some(image),
             image_id: Some(image_id),
-            elf_bytes: elf.to_vec(),
+            elf_bytes: elf,
         })
     }
 
@@ -1,5 +1,7 @@
 use pyo3::prelude::*;
 use pyo3::exceptions::PyValueError;
+use pyo3::types::PyTuple;
+use crate::buffer::with_bytes;
 
 /// A builder for constructing input data for RISC Zero guests
 /// 
@@ -25,13 +27,27 @@ pub struct InputBuilder {
 #[pymethods]
 impl InputBuilder {
     /// Create a new InputBuilder
+    /// 
+    /// Args:
+    ///     capacity: Optional number of bytes to preallocate, so building an
+    ///               input of known size never regrows the buffer
     #[new]
-    pub fn new() -> Self {
+    #[pyo3(signature = (capacity=None))]
+    pub fn new(capacity: Option<usize>) -> Self {
         Self {
-            data: Vec::new(),
+            data: Vec::with_capacity(capacity.unwrap_or(0)),
         }
     }
     
+    /// Reserve room for exactly `additional` more bytes
+    /// 
+    /// Call before a series of writes whose total size is known so they
+    /// fill one allocation. Returns self for method chaining.
+    pub fn reserve(mut slf: PyRefMut<Self>, additional: usize) -> PyRefMut<Self> {
+        slf.data.reserve_exact(additional);
+        slf
+    }
+    
     /// Write CBOR-encoded data WITHOUT length prefix (Pattern A: CBOR-only)
     /// 
     /// ⚠️ Use this ONLY if your entire input is a single CBOR object.
@@ -50,9 +66,9 @@ impl InputBuilder {
     /// env::stdin().read_to_end(&mut buf).unwrap();
     /// let input: Input = minicbor::decode(&buf).unwrap();  // Entire buffer is CBOR
     /// ```
-    pub fn write_cbor(mut slf: PyRefMut<Self>, cbor_bytes: Vec<u8>) -> PyRefMut<Self> {
-        slf.data.extend_from_slice(&cbor_bytes);
-        slf
+    pub fn write_cbor<'py>(mut slf: PyRefMut<'py, Self>, cbor_bytes: &Bound<'py, PyAny>) -> PyResult<PyRefMut<'py, Self>> {
+        with_bytes(cbor_bytes, |bytes| slf.write_cbor_internal(bytes))?;
+        Ok(slf)
     }
     
     /// Write a u32 value (4 bytes, little-endian) for Pattern B: Raw-only
@@ -90,13 +106,10 @@ impl InputBuilder {
     /// let mut bytes = [0u8; 32];
     /// env::read_slice(&mut bytes);
     /// ```
-    pub fn write_bytes32(mut slf: PyRefMut<Self>, data: Vec<u8>) -> PyResult<PyRefMut<Self>> {
-        if data.len() != 32 {
-            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                format!("write_bytes32 requires exactly 32 bytes, got {}", data.len())
-            ));
-        }
-        slf.data.extend_from_slice(&data);
+    pub fn write_bytes32<'py>(mut slf: PyRefMut<'py, Self>, data: &Bound<'py, PyAny>) -> PyResult<PyRefMut<'py, Self>> {
+        // Check the length on the borrowed bytes; only 32 bytes are ever copied
+        with_bytes(data, |bytes| slf.write_bytes32_internal(bytes))?
+            .map_err(PyValueError::new_err)?;
         Ok(slf)
     }
     
@@ -107,7 +120,7 @@ impl InputBuilder {
     /// let mut image_id = [0u8; 32];
     /// env::read_slice(&mut image_id);
     /// ```
-    pub fn write_image_id(slf: PyRefMut<Self>, image_id: Vec<u8>) -> PyResult<PyRefMut<Self>> {
+    pub fn write_image_id<'py>(slf: PyRefMut<'py, Self>, image_id: &Bound<'py, PyAny>) -> PyResult<PyRefMut<'py, Self>> {
         Self::write_bytes32(slf, image_id)
     }
     
@@ -125,9 +138,40 @@ impl InputBuilder {
     /// For variable-length data, use write_frame() or write_cbor_frame().
     /// 
     /// Returns self for method chaining.
-    pub fn write_raw_bytes(mut slf: PyRefMut<Self>, data: Vec<u8>) -> PyRefMut<Self> {
-        slf.data.extend_from_slice(&data);
-        slf
+    pub fn write_raw_bytes<'py>(mut slf: PyRefMut<'py, Self>, data: &Bound<'py, PyAny>) -> PyResult<PyRefMut<'py, Self>> {
+        with_bytes(data, |bytes| slf.write_raw_bytes_internal(bytes))?;
+        Ok(slf)
+    }
+    
+    /// Write several raw fields in one call from a struct-style format
+    /// 
+    /// Format codes (concatenated in order, no padding):
+    /// - `I`: u32, 4 bytes little-endian (like write_u32)
+    /// - `Q`: u64, 8 bytes little-endian (like write_u64)
+    /// - `Ns`: exactly N raw bytes, e.g. `32s` for an image ID
+    /// 
+    /// If any value is rejected, the fields this call already wrote are
+    /// removed again, so the builder is left as it was.
+    /// 
+    /// **Python code:**
+    /// ```python
+    /// # Same bytes as builder.write_u32(total).write_image_id(image.id)
+    /// builder.write_packed("I32s", total, image.id)
+    /// ```
+    /// 
+    /// Returns self for method chaining.
+    /// 
+    /// Raises:
+    ///     ValueError: If the format is invalid, the value count doesn't
+    ///                 match, or an `Ns` value has the wrong length
+    ///     OverflowError: If an `I`/`Q` value is negative or too large
+    ///                    (as for write_u32/write_u64)
+    ///     TypeError: If a value has the wrong type (not an int for `I`/`Q`,
+    ///                not bytes-like for `Ns`)
+    #[pyo3(signature = (format, *values))]
+    pub fn write_packed<'py>(mut slf: PyRefMut<'py, Self>, format: &str, values: &Bound<'py, PyTuple>) -> PyResult<PyRefMut<'py, Self>> {
+        slf.write_packed_internal(format, values)?;
+        Ok(slf)
     }
     
     /// Build the final input data bytes
@@ -148,6 +192,35 @@ impl InputBuilder {
         self.data.clear();
     }
     
+    /// Discard everything written after the first `size` bytes
+    /// 
+    /// Lets a constant input prefix be serialized once and reused across
+    /// many proofs: write the shared fields, remember `builder.size`, and
+    /// truncate back to it before appending each proof's own fields. The
+    /// allocation is kept, so later writes do not regrow the buffer.
+    /// 
+    /// **Python code:**
+    /// ```python
+    /// builder.write_image_id(image.id)
+    /// prefix = builder.size
+    /// for value in values:
+    ///     builder.truncate(prefix)
+    ///     builder.write_u32(value)
+    ///     receipt = pyr0.prove(image, builder.build())
+    /// ```
+    /// 
+    /// Raises:
+    ///     ValueError: If size is larger than the current data
+    pub fn truncate(mut slf: PyRefMut<Self>, size: usize) -> PyResult<PyRefMut<Self>> {
+        if size > slf.data.len() {
+            return Err(PyValueError::new_err(
+                format!("Cannot truncate to {} bytes, builder only holds {}", size, slf.data.len())
+            ));
+        }
+        slf.data.truncate(size);
+        Ok(slf)
+    }
+    
     /// Write CBOR with length frame (Pattern C: Safe mixing)
     /// 
     /// Writes: [u64 length in little-endian][CBOR bytes]
@@ -176,11 +249,9 @@ impl InputBuilder {
     /// env::read_slice(&mut n);
     /// let extra = u32::from_le_bytes(n);
     /// ```
-    pub fn write_cbor_frame(mut slf: PyRefMut<Self>, cbor_bytes: Vec<u8>) -> PyRefMut<Self> {
-        let len = cbor_bytes.len() as u64;
-        slf.data.extend_from_slice(&len.to_le_bytes());
-        slf.data.extend_from_slice(&cbor_bytes);
-        slf
+    pub fn write_cbor_frame<'py>(mut slf: PyRefMut<'py, Self>, cbor_bytes: &Bound<'py, PyAny>) -> PyResult<PyRefMut<'py, Self>> {
+        with_bytes(cbor_bytes, |bytes| slf.write_cbor_frame_internal(bytes))?;
+        Ok(slf)
     }
     
     /// Write raw bytes with length frame (Pattern C: Safe for variable-length)
@@ -195,26 +266,25 @@ impl InputBuilder {
     /// let mut data = vec![0u8; len];
     /// env::read_slice(&mut data);
     /// ```
-    pub fn write_frame(mut slf: PyRefMut<Self>, data: Vec<u8>) -> PyRefMut<Self> {
-        let len = data.len() as u64;
-        slf.data.extend_from_slice(&len.to_le_bytes());
-        slf.data.extend_from_slice(&data);
-        slf
+    pub fn write_frame<'py>(mut slf: PyRefMut<'py, Self>, data: &Bound<'py, PyAny>) -> PyResult<PyRefMut<'py, Self>> {
+        with_bytes(data, |bytes| slf.write_frame_internal(bytes))?;
+        Ok(slf)
     }
 }
 
 // Internal methods for use from Rust code (e.g., Composer)
 impl InputBuilder {
     /// Internal version of write_cbor that doesn't need PyRefMut
-    pub(crate) fn write_cbor_internal(&mut self, cbor_bytes: Vec<u8>) {
-        self.data.extend_from_slice(&cbor_bytes);
+    pub(crate) fn write_cbor_internal(&mut self, cbor_bytes: &[u8]) {
+        self.data.extend_from_slice(cbor_bytes);
     }
     
     /// Internal version of write_cbor_frame that doesn't need PyRefMut
-    pub(crate) fn write_cbor_frame_internal(&mut self, cbor_bytes: Vec<u8>) {
+    pub(crate) fn write_cbor_frame_internal(&mut self, cbor_bytes: &[u8]) {
         let len = cbor_bytes.len() as u64;
+        self.data.reserve(8 + cbor_bytes.len());
         self.data.extend_from_slice(&len.to_le_bytes());
-        self.data.extend_from_slice(&cbor_bytes);
+        self.data.extend_from_slice(cbor_bytes);
     }
     
     /// Internal version of write_u32 that doesn't need PyRefMut
@@ -228,23 +298,87 @@ impl InputBuilder {
     }
     
     /// Internal version of write_bytes32 that doesn't need PyRefMut
-    pub(crate) fn write_bytes32_internal(&mut self, data: Vec<u8>) -> Result<(), String> {
-        if data.len() != 32 {
-            return Err(format!("write_bytes32 requires exactly 32 bytes, got {}", data.len()));
+    pub(crate) fn write_bytes32_internal(&mut self, data: &[u8]) -> Result<(), String> {
+        let bytes: &[u8; 32] = data.try_into()
+            .map_err(|_| format!("write_bytes32 requires exactly 32 bytes, got {}", data.len()))?;
+        self.data.extend_from_slice(bytes);
+        Ok(())
+    }
+    
+    /// Internal version of write_packed that doesn't need PyRefMut
+    pub(crate) fn write_packed_internal(&mut self, format: &str, values: &Bound<'_, PyTuple>) -> PyResult<()> {
+        let start = self.data.len();
+        let result = self.pack_values(format, values);
+        if result.is_err() {
+            // Drop any fields already written by this call
+            self.data.truncate(start);
+        }
+        result
+    }
+    
+    fn pack_values(&mut self, format: &str, values: &Bound<'_, PyTuple>) -> PyResult<()> {
+        let mut remaining = values.iter();
+        let mut count: Option<usize> = None;
+        
+        for code in format.chars() {
+            if let Some(digit) = code.to_digit(10) {
+                let size = count.unwrap_or(0).checked_mul(10)
+                    .and_then(|size| size.checked_add(digit as usize))
+                    .ok_or_else(|| PyValueError::new_err(
+                        format!("Invalid write_packed format '{}': byte count too large", format)
+                    ))?;
+                count = Some(size);
+                continue;
+            }
+            // Check the code before consuming a value for it
+            let size = count.take();
+            if !matches!((code, size), ('I', None) | ('Q', None) | ('s', Some(_))) {
+                return Err(PyValueError::new_err(
+                    format!("Invalid write_packed format '{}': use I, Q or Ns (e.g. \"I32s\")", format)
+                ));
+            }
+            let value = remaining.next().ok_or_else(|| PyValueError::new_err(
+                format!("write_packed format '{}' needs more than {} values", format, values.len())
+            ))?;
+            match (code, size) {
+                ('I', _) => self.data.extend_from_slice(&value.extract::<u32>()?.to_le_bytes()),
+                ('Q', _) => self.data.extend_from_slice(&value.extract::<u64>()?.to_le_bytes()),
+                (_, Some(size)) => with_bytes(&value, |bytes| {
+                    if bytes.len() != size {
+                        return Err(PyValueError::new_err(
+                            format!("write_packed '{}s' requires exactly {} bytes, got {}", size, size, bytes.len())
+                        ));
+                    }
+                    self.data.extend_from_slice(bytes);
+                    Ok(())
+                })??,
+                _ => unreachable!("format code checked above"),
+            }
+        }
+        
+        if count.is_some() {
+            return Err(PyValueError::new_err(
+                format!("Invalid write_packed format '{}': byte count without 's'", format)
+            ));
+        }
+        if remaining.next().is_some() {
+            return Err(PyValueError::new_err(
+                format!("write_packed format '{}' takes fewer than {} values", format, values.len())
+            ));
         }
-        self.data.extend_from_slice(&data);
         Ok(())
     }
     
     /// Internal version of write_raw_bytes that doesn't need PyRefMut
-    pub(crate) fn write_raw_bytes_internal(&mut self, data: Vec<u8>) {
-        self.data.extend_from_slice(&data);
+    pub(crate) fn write_raw_bytes_internal(&mut self, data: &[u8]) {
+        self.data.extend_from_slice(data);
     }
     
     /// Internal version of write_frame that doesn't need PyRefMut
-    pub(crate) fn write_frame_internal(&mut self, data: Vec<u8>) {
+    pub(crate) fn write_frame_internal(&mut self, data: &[u8]) {
         let len = data.len() as u64;
+        self.data.reserve(8 + data.len());
         self.data.extend_from_slice(&len.to_le_bytes());
-        self.data.extend_from_slice(&data);
+        self.data.extend_from_slice(data);
     }
 }
\ No newline at end of file
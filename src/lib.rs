@@ -4,78 +4,113 @@ mod session;
 mod claim;
 mod composer;
 mod input_builder;
+mod buffer;
 
 use crate::image::Image;
-use crate::receipt::{Receipt, ExitStatus, ExitKind, ReceiptKind};
+use crate::receipt::{Receipt, ExitStatus, ExitKind, ReceiptKind, image_id_digest};
 use crate::session::{ExitCode, SessionInfo};
 use crate::claim::Claim;
 use crate::composer::Composer;
 use crate::input_builder::InputBuilder;
+use crate::buffer::extract_bytes;
 use pyo3::prelude::*;
+use pyo3::types::PyString;
+use std::path::PathBuf;
 use risc0_zkvm::{default_prover, ExecutorEnv, ProverOpts};
 
+/// Get ELF contents from a path (str or os.PathLike) or a bytes-like object
+fn read_elf(py: Python<'_>, elf: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
+    if elf.is_instance_of::<PyString>() || elf.hasattr("__fspath__")? {
+        // Read the file straight into Rust memory - no Python bytes object
+        let path: PathBuf = elf.extract()?;
+        Ok(py.allow_threads(|| std::fs::read(&path))?)
+    } else {
+        extract_bytes(elf)
+    }
+}
+
+/// Load a guest ELF into an Image
+/// 
+/// Args:
+///     elf: The ELF binary as bytes or any buffer-protocol object
+///          (bytearray, memoryview, mmap.mmap, ...), or a path to the
+///          ELF file (str or os.PathLike, e.g. the result of build_guest)
+/// 
+/// Returns:
+///     Image: The loaded image with its computed image ID
+/// 
+/// Raises:
+///     OSError: If a path is given and the file can't be read
+///     ValueError: If the data is not a valid guest ELF
 #[pyfunction]
-fn load_image(elf: &Bound<'_, PyAny>) -> PyResult<Image> {
-    let elf_bytes: Vec<u8> = elf.extract()?;
-    // Compute the image ID from the ELF
-    let image_id = risc0_binfmt::compute_image_id(&elf_bytes)
-        .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Failed to compute image ID: {}", e)))?;
-    
-    Ok(Image::from_elf(&elf_bytes, image_id)?)
+fn load_image(py: Python<'_>, elf: &Bound<'_, PyAny>) -> PyResult<Image> {
+    let elf_bytes = read_elf(py, elf)?;
+    // Parse the ELF once; the image ID is computed from the same memory image
+    Image::from_elf(elf_bytes)
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Failed to load ELF image: {}", e)))
 }
 
 // For testing/debugging - execute without proving
 #[pyfunction]
 #[pyo3(signature = (image, input_bytes))]
 fn dry_run(
-    _py: Python<'_>,
+    py: Python<'_>,
     image: &Image,
     input_bytes: &Bound<'_, PyAny>,
 ) -> PyResult<SessionInfo> {
     // Accept any bytes-like object and convert to bytes
-    let bytes: Vec<u8> = input_bytes.extract()?;
+    let bytes = extract_bytes(input_bytes)?;
+    let memory_image = image.get_image();
     
-    let env = ExecutorEnv::builder()
-        .write_slice(&bytes)
-        .build()?;
+    // Execution is pure Rust - release the GIL so other Python threads run
+    let session_info = py.allow_threads(|| -> anyhow::Result<SessionInfo> {
+        let env = ExecutorEnv::builder()
+            .write_slice(&bytes)
+            .build()?;
 
-    let mut exec = risc0_zkvm::ExecutorImpl::new(env, image.get_image())?;
-    let session = exec.run()?;
+        let mut exec = risc0_zkvm::ExecutorImpl::new(env, memory_image)?;
+        let session = exec.run()?;
+        
+        SessionInfo::new(&session)
+    })?;
     
-    Ok(SessionInfo::new(&session)?)
+    Ok(session_info)
 }
 
 
 /// Unified function to execute and prove in one call
+/// 
+/// The GIL is released while proving, so several proofs can run in
+/// parallel from Python threads (e.g. a ThreadPoolExecutor).
 #[pyfunction]
 #[pyo3(signature = (image, input_bytes))]
-fn prove(_py: Python<'_>, image: &Image, input_bytes: &Bound<'_, PyAny>) -> PyResult<Receipt> {
+fn prove(py: Python<'_>, image: &Image, input_bytes: &Bound<'_, PyAny>) -> PyResult<Receipt> {
     // Accept any bytes-like object and convert to bytes
-    let bytes: Vec<u8> = input_bytes.extract()?;
-    
-    // Build the execution environment
-    let env = ExecutorEnv::builder()
-        .write_slice(&bytes)
-        .build()?;
+    let bytes = extract_bytes(input_bytes)?;
+    let elf = image.get_elf();
     
-    // Use RISC Zero's high-level API - no segment handling needed!
-    let receipt = default_prover()
-        .prove(env, image.get_elf())?
-        .receipt;
+    let receipt = py.allow_threads(|| -> anyhow::Result<_> {
+        // Build the execution environment
+        let env = ExecutorEnv::builder()
+            .write_slice(&bytes)
+            .build()?;
+        
+        // Use RISC Zero's high-level API - no segment handling needed!
+        Ok(default_prover().prove(env, elf)?.receipt)
+    })?;
     
     // Return a Receipt that wraps the RISC Zero receipt
     Ok(Receipt::from_risc0(receipt))
 }
 
 /// Execute and prove with specific options (e.g., succinct, groth16)
+/// 
+/// Like prove(), this releases the GIL while proving.
 #[pyfunction]
 #[pyo3(signature = (image, input_bytes, succinct=false))]
-fn prove_with_opts(_py: Python<'_>, image: &Image, input_bytes: &Bound<'_, PyAny>, succinct: bool) -> PyResult<Receipt> {
-    let bytes: Vec<u8> = input_bytes.extract()?;
-    
-    let env = ExecutorEnv::builder()
-        .write_slice(&bytes)
-        .build()?;
+fn prove_with_opts(py: Python<'_>, image: &Image, input_bytes: &Bound<'_, PyAny>, succinct: bool) -> PyResult<Receipt> {
+    let bytes = extract_bytes(input_bytes)?;
+    let elf = image.get_elf();
     
     let opts = if succinct {
         ProverOpts::succinct()
@@ -83,9 +118,13 @@ fn prove_with_opts(_py: Python<'_>, image: &Image, input_bytes: &Bound<'_, PyAny
         ProverOpts::default()
     };
     
-    let receipt = default_prover()
-        .prove_with_opts(env, image.get_elf(), &opts)?
-        .receipt;
+    let receipt = py.allow_threads(|| -> anyhow::Result<_> {
+        let env = ExecutorEnv::builder()
+            .write_slice(&bytes)
+            .build()?;
+        
+        Ok(default_prover().prove_with_opts(env, elf, &opts)?.receipt)
+    })?;
     
     Ok(Receipt::from_risc0(receipt))
 }
@@ -93,7 +132,8 @@ fn prove_with_opts(_py: Python<'_>, image: &Image, input_bytes: &Bound<'_, PyAny
 /// Convenience function to directly generate a succinct proof
 /// 
 /// This is equivalent to prove_with_opts(image, input_bytes, succinct=True)
-/// but more explicit about generating an unconditional proof.
+/// but more explicit about generating an unconditional proof. The GIL is
+/// released while proving.
 /// 
 /// Args:
 ///     image: The Image containing the RISC-V ELF
@@ -102,16 +142,17 @@ fn prove_with_opts(_py: Python<'_>, image: &Image, input_bytes: &Bound<'_, PyAny
 /// Returns:
 ///     Receipt: A succinct receipt with no unresolved assumptions
 #[pyfunction]
-fn prove_succinct(_py: Python<'_>, image: &Image, input_bytes: &Bound<'_, PyAny>) -> PyResult<Receipt> {
-    let bytes: Vec<u8> = input_bytes.extract()?;
+fn prove_succinct(py: Python<'_>, image: &Image, input_bytes: &Bound<'_, PyAny>) -> PyResult<Receipt> {
+    let bytes = extract_bytes(input_bytes)?;
+    let elf = image.get_elf();
     
-    let env = ExecutorEnv::builder()
-        .write_slice(&bytes)
-        .build()?;
-    
-    let receipt = default_prover()
-        .prove_with_opts(env, image.get_elf(), &ProverOpts::succinct())?
-        .receipt;
+    let receipt = py.allow_threads(|| -> anyhow::Result<_> {
+        let env = ExecutorEnv::builder()
+            .write_slice(&bytes)
+            .build()?;
+        
+        Ok(default_prover().prove_with_opts(env, elf, &ProverOpts::succinct())?.receipt)
+    })?;
     
     Ok(Receipt::from_risc0(receipt))
 }
@@ -122,20 +163,81 @@ fn prove_succinct(_py: Python<'_>, image: &Image, input_bytes: &Bound<'_, PyAny>
 
 /// Compute the expected image ID from an ELF file as hex string
 /// 
+/// The ELF is hashed with the GIL released. If an Image is already loaded,
+/// its id_hex property gives the same value without hashing again.
+/// 
 /// Args:
-///     elf_bytes: The ELF binary to compute ID from
+///     elf_bytes: The ELF binary to compute ID from (bytes or any
+///                buffer-protocol object), or a path to the ELF file
 /// 
 /// Returns:
 ///     64-character hex string of the image ID
+/// 
+/// Raises:
+///     OSError: If a path is given and the file can't be read
+///     ValueError: If the data is not a valid guest ELF
 #[pyfunction]
-fn compute_image_id_hex(elf_bytes: Vec<u8>) -> PyResult<String> {
-    let image_id = risc0_binfmt::compute_image_id(&elf_bytes)
+fn compute_image_id_hex(py: Python<'_>, elf_bytes: &Bound<'_, PyAny>) -> PyResult<String> {
+    let elf_bytes = read_elf(py, elf_bytes)?;
+    let image_id = py.allow_threads(|| risc0_binfmt::compute_image_id(&elf_bytes))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(
             format!("Failed to compute image ID: {}", e)
         ))?;
     Ok(hex::encode(image_id))
 }
 
+/// Verify several receipts in one call
+/// 
+/// The receipts are checked in parallel on a pool of native threads with
+/// the GIL released, so a batch costs roughly one verification per core
+/// instead of one after another.
+/// 
+/// Args:
+///     items: List of (receipt, image_id) pairs, where image_id takes the
+///            same forms as Receipt.verify (32 bytes, hex string or Image)
+/// 
+/// Raises:
+///     ValueError: If any image ID is malformed (checked before verifying)
+///     RuntimeError: If any receipt fails verification; the message names
+///                   the index of the first failing pair
+#[pyfunction]
+fn verify_batch<'py>(py: Python<'py>, items: Vec<(PyRef<'py, Receipt>, Bound<'py, PyAny>)>) -> PyResult<()> {
+    let digests = items.iter()
+        .map(|(_, image_id)| image_id_digest(image_id))
+        .collect::<PyResult<Vec<_>>>()?;
+    let jobs: Vec<_> = items.iter()
+        .map(|(receipt, _)| &**receipt)
+        .zip(digests)
+        .collect();
+    
+    let workers = std::thread::available_parallelism().map_or(1, |n| n.get());
+    let chunk_size = jobs.len().div_ceil(workers).max(1);
+    
+    let failure = py.allow_threads(|| {
+        std::thread::scope(|scope| {
+            let handles: Vec<_> = jobs.chunks(chunk_size)
+                .enumerate()
+                .map(|(chunk_index, chunk)| scope.spawn(move || {
+                    chunk.iter().enumerate().find_map(|(offset, (receipt, digest))| {
+                        receipt.verify_once(*digest).err()
+                            .map(|e| (chunk_index * chunk_size + offset, e.to_string()))
+                    })
+                }))
+                .collect();
+            // Chunks are in order, so the first failure found is the lowest index
+            handles.into_iter()
+                .find_map(|handle| handle.join().expect("verifier thread panicked"))
+        })
+    });
+    
+    match failure {
+        Some((index, e)) => Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+            format!("Verification failed for receipt {}: {}", index, e)
+        )),
+        None => Ok(()),
+    }
+}
+
 /// Compress a composite receipt to succinct format
 /// 
 /// This runs the recursion program to resolve all assumptions,
@@ -156,7 +258,7 @@ fn compute_image_id_hex(elf_bytes: Vec<u8>) -> PyResult<String> {
 #[pyfunction]
 #[pyo3(signature = (receipt, assumptions=None))]
 fn compress_to_succinct(
-    _py: Python<'_>, 
+    py: Python<'_>, 
     receipt: &Receipt,
     assumptions: Option<Vec<PyRef<Receipt>>>
 ) -> PyResult<Receipt> {
@@ -195,8 +297,7 @@ fn compress_to_succinct(
             // composite receipt as input, which isn't directly exposed
             
             // For now, attempt direct compression and provide clear error
-            let compressed = risc0_zkvm::default_prover()
-                .compress(&ProverOpts::succinct(), &receipt.inner)
+            let compressed = py.allow_threads(|| risc0_zkvm::default_prover().compress(&ProverOpts::succinct(), &receipt.inner))
                 .map_err(|e| {
                     if e.to_string().contains("assumption") {
                         PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
@@ -215,9 +316,8 @@ fn compress_to_succinct(
         }
     }
     
-    // Attempt compression without assumptions
-    let compressed = risc0_zkvm::default_prover()
-        .compress(&ProverOpts::succinct(), &receipt.inner)
+    // Attempt compression without assumptions (pure Rust - GIL released)
+    let compressed = py.allow_threads(|| risc0_zkvm::default_prover().compress(&ProverOpts::succinct(), &receipt.inner))
         .map_err(|e| {
             if e.to_string().contains("assumption") || e.to_string().contains("unresolved") {
                 PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
@@ -258,6 +358,7 @@ fn _rust(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(prove_succinct, m)?)?;
     m.add_function(wrap_pyfunction!(compute_image_id_hex, m)?)?;
     m.add_function(wrap_pyfunction!(compress_to_succinct, m)?)?;
+    m.add_function(wrap_pyfunction!(verify_batch, m)?)?;
     
     // Optional debugging function
     m.add_function(wrap_pyfunction!(dry_run, m)?)?;
@@ -1,7 +1,28 @@
-from pyr0._rust import *
+from pyr0._rust import (
+    load_image,
+    prove,
+    prove_with_opts,
+    prove_succinct,
+    compute_image_id_hex,
+    compress_to_succinct,
+    verify_batch,
+    dry_run,
+    Image,
+    Receipt,
+    ExitCode,
+    SessionInfo,
+    ExitStatus,
+    ExitKind,
+    ReceiptKind,
+    Claim,
+    Composer,
+    InputBuilder,
+)
 from pyr0 import serialization
+from pyr0.images import load_image_cached, clear_image_cache
 from pyr0.build import (
     build_guest,
+    build_guests,
     BuildError,
     GuestBuildFailedError,
     ElfNotFoundError,
@@ -19,14 +40,18 @@ from pyr0.exceptions import (
 __all__ = [
     # Core API functions
     "load_image",
+    "load_image_cached",
+    "clear_image_cache",
     "prove",
     "prove_with_opts",
     "prove_succinct",
     "compute_image_id_hex",
     "compress_to_succinct",
+    "verify_batch",
     
     # Build functions
     "build_guest",
+    "build_guests",
     
     # Debugging functions
     "dry_run",
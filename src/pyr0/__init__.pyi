@@ -10,6 +10,7 @@ from pyr0._rust import (
     Receipt as Receipt,
     Claim as Claim,
     Composer as Composer,
+    InputBuilder as InputBuilder,
     SessionInfo as SessionInfo,
     ExitStatus as ExitStatus,
     ExitCode as ExitCode,
@@ -22,20 +23,29 @@ from pyr0._rust import (
     load_image as load_image,
     prove as prove,
     prove_with_opts as prove_with_opts,
+    prove_succinct as prove_succinct,
     compute_image_id_hex as compute_image_id_hex,
     compress_to_succinct as compress_to_succinct,
+    verify_batch as verify_batch,
     dry_run as dry_run,
 )
 
 # From build module
 from pyr0.build import (
     build_guest as build_guest,
+    build_guests as build_guests,
     BuildError as BuildError,
     GuestBuildFailedError as GuestBuildFailedError,
     ElfNotFoundError as ElfNotFoundError,
     InvalidGuestDirectoryError as InvalidGuestDirectoryError,
 )
 
+# From images module
+from pyr0.images import (
+    load_image_cached as load_image_cached,
+    clear_image_cache as clear_image_cache,
+)
+
 # Serialization module
 from pyr0 import serialization as serialization
 
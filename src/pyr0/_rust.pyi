@@ -2,6 +2,11 @@
 
 from typing import Union, Optional, List, Tuple, overload, Literal
 from enum import Enum
+import mmap
+import os
+
+# Anything exporting the buffer protocol is accepted where bytes are read
+BytesLike = Union[bytes, bytearray, memoryview, mmap.mmap]
 
 # Enums
 class ReceiptKind(Enum):
@@ -105,7 +110,7 @@ class Receipt:
     def verify(self, image_id: Image) -> None: ...
     
     def verify_hex(self, image_id_hex: str) -> None: ...
-    def verify_bytes(self, image_id: bytes) -> None: ...
+    def verify_bytes(self, image_id: BytesLike) -> None: ...
     def verify_integrity(self) -> None: ...
     def verify_with_image_id(self, image_id: Union[bytes, str, Image]) -> None: ...  # Deprecated
     
@@ -114,7 +119,29 @@ class Receipt:
     # Serialization
     def to_bytes(self) -> bytes: ...
     @staticmethod
-    def from_bytes(data: bytes) -> 'Receipt': ...
+    def from_bytes(data: BytesLike) -> 'Receipt': ...
+
+class InputBuilder:
+    def __init__(self, capacity: Optional[int] = None) -> None: ...
+    
+    # Writers (all return self for chaining)
+    def write_cbor(self, cbor_bytes: BytesLike) -> 'InputBuilder': ...
+    def write_cbor_frame(self, cbor_bytes: BytesLike) -> 'InputBuilder': ...
+    def write_u32(self, value: int) -> 'InputBuilder': ...
+    def write_u64(self, value: int) -> 'InputBuilder': ...
+    def write_bytes32(self, data: BytesLike) -> 'InputBuilder': ...
+    def write_image_id(self, image_id: BytesLike) -> 'InputBuilder': ...
+    def write_raw_bytes(self, data: BytesLike) -> 'InputBuilder': ...
+    def write_frame(self, data: BytesLike) -> 'InputBuilder': ...
+    def write_packed(self, format: str, *values: Union[int, BytesLike]) -> 'InputBuilder': ...
+    
+    # Buffer management
+    def build(self) -> bytes: ...
+    def clear(self) -> None: ...
+    def truncate(self, size: int) -> 'InputBuilder': ...
+    def reserve(self, additional: int) -> 'InputBuilder': ...
+    @property
+    def size(self) -> int: ...
 
 class Composer:
     def __init__(self, image: Image) -> None: ...
@@ -126,8 +153,9 @@ class Composer:
     # Writers for env::read_slice()
     def write_u32(self, value: int) -> None: ...
     def write_u64(self, value: int) -> None: ...
-    def write_bytes32(self, data: bytes) -> None: ...
-    def write_image_id(self, image_id: bytes) -> None: ...
+    def write_bytes32(self, data: BytesLike) -> None: ...
+    def write_image_id(self, image_id: BytesLike) -> None: ...
+    def write_packed(self, format: str, *values: Union[int, BytesLike]) -> None: ...
     def write_slice(self, data: bytes) -> None: ...
     
     # Writers for env::read::<T>()
@@ -138,7 +166,7 @@ class Composer:
     def write_journal_from(self, receipt: Receipt) -> None: ...
     
     # Verification setup
-    def expect_verification(self, image_id: bytes, journal: bytes) -> None: ...
+    def expect_verification(self, image_id: BytesLike, journal: BytesLike) -> None: ...
     def preflight_check(self, raise_on_error: bool = True) -> List[str]: ...
     
     # Proving - polymorphic!
@@ -167,23 +195,27 @@ class ExitCode:
     SystemSplit: int
 
 # Functions
-def load_image(elf: bytes) -> Image: ...
+def load_image(elf: Union[BytesLike, str, os.PathLike]) -> Image: ...
 
-def prove(image: Image, input_bytes: bytes) -> Receipt: ...
+def prove(image: Image, input_bytes: BytesLike) -> Receipt: ...
 
 def prove_with_opts(
     image: Image, 
-    input_bytes: bytes, 
+    input_bytes: BytesLike, 
     succinct: bool = False
 ) -> Receipt: ...
 
-def prove_succinct(image: Image, input_bytes: bytes) -> Receipt: ...
+def prove_succinct(image: Image, input_bytes: BytesLike) -> Receipt: ...
 
-def compute_image_id_hex(elf_bytes: bytes) -> str: ...
+def compute_image_id_hex(elf_bytes: Union[BytesLike, str, os.PathLike]) -> str: ...
 
 def compress_to_succinct(
     receipt: Receipt,
     assumptions: Optional[List[Receipt]] = None
 ) -> Receipt: ...
 
-def dry_run(image: Image, input_bytes: bytes) -> SessionInfo: ...
\ No newline at end of file
+def verify_batch(
+    items: List[Tuple[Receipt, Union[bytes, str, Image]]]
+) -> None: ...
+
+def dry_run(image: Image, input_bytes: BytesLike) -> SessionInfo: ...
\ No newline at end of file
@@ -2,11 +2,18 @@
 Guest building functionality for PyR0.
 """
 
+import hashlib
+import json
 import subprocess
 import os
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from threading import Thread
+from typing import Iterable, List, Optional
 
 
 class BuildError(Exception):
@@ -29,10 +36,204 @@ class InvalidGuestDirectoryError(BuildError):
     pass
 
 
+def _cargo_metadata(manifest_dir: Path, no_deps: bool = True) -> dict:
+    """
+    Return `cargo metadata` for the crate in manifest_dir, or an empty dict
+    if cargo can't answer. With no_deps=False the packages also include
+    every dependency (path dependencies have a null "source"). Not cached:
+    CARGO_TARGET_DIR or a .cargo/config change between builds must be
+    picked up.
+    """
+    cmd = ["cargo", "metadata", "--format-version=1"]
+    if no_deps:
+        cmd.append("--no-deps")
+    try:
+        result = subprocess.run(
+            cmd,
+            cwd=manifest_dir,
+            capture_output=True,
+            check=False
+        )
+    except (FileNotFoundError, subprocess.SubprocessError):
+        return {}
+    if result.returncode != 0:
+        return {}
+    try:
+        return json.loads(result.stdout)
+    except ValueError:
+        return {}
+
+
+# Environment variable prefixes that can change what cargo and rustc build
+_FINGERPRINT_ENV_PREFIXES = ("CARGO", "RUST", "RISC0")
+
+# Files looked up from each crate directory to the filesystem root
+_FINGERPRINT_CONFIG_FILES = (".cargo/config", ".cargo/config.toml", "rust-toolchain", "rust-toolchain.toml")
+
+
+def _tree_files(root: Path) -> Iterable[Path]:
+    """Yield every file under root, skipping target/ and hidden directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != "target" and not d.startswith(".")]
+        for name in filenames:
+            yield Path(dirpath) / name
+
+
+def _build_fingerprint(binary_name: str, build_dir: Path, metadatas: List[dict]) -> Optional[str]:
+    """
+    Hash everything outside the target directory that decides a guest's ELF:
+    
+    - the manifest, build script and target source trees of every local
+      package (workspace members and path dependencies) in metadatas, plus
+      each workspace's root Cargo.toml and Cargo.lock
+    - .cargo/config[.toml] and rust-toolchain[.toml] from those packages and
+      build_dir up to the filesystem root, and CARGO_HOME's config
+    - CARGO*, RUST* and RISC0* environment variables
+    - the `rustc -vV` output of the host and risc0 toolchains
+    
+    Returns None if cargo metadata or either toolchain can't be queried; the
+    caller then always runs cargo.
+    """
+    if not all(metadatas):
+        return None
+    
+    hasher = hashlib.sha256()
+    
+    def update(field: bytes) -> None:
+        # Length-prefix every field so different inputs can't collide
+        hasher.update(len(field).to_bytes(8, "little") + field)
+    
+    update(binary_name.encode())
+    
+    for cmd in (["rustc", "-vV"], ["rustc", "+risc0", "-vV"]):
+        try:
+            result = subprocess.run(cmd, cwd=build_dir, capture_output=True, check=False)
+        except (FileNotFoundError, subprocess.SubprocessError):
+            return None
+        if result.returncode != 0:
+            return None
+        update(result.stdout)
+    
+    for name in sorted(os.environ):
+        if name.startswith(_FINGERPRINT_ENV_PREFIXES):
+            update(f"{name}={os.environ[name]}".encode())
+    
+    files = set()
+    crate_dirs = {build_dir}
+    for metadata in metadatas:
+        workspace_root = Path(metadata["workspace_root"])
+        files.update((workspace_root / "Cargo.toml", workspace_root / "Cargo.lock"))
+        for package in metadata["packages"]:
+            if package["source"] is not None:
+                continue  # Registry and git dependencies are pinned by Cargo.lock
+            manifest = Path(package["manifest_path"])
+            crate_dirs.add(manifest.parent)
+            files.add(manifest)
+            for target in package["targets"]:
+                src_path = Path(target["src_path"])
+                if "custom-build" in target["kind"]:
+                    files.add(src_path)
+                else:
+                    files.update(_tree_files(src_path.parent))
+    
+    for crate_dir in crate_dirs:
+        for directory in (crate_dir, *crate_dir.parents):
+            files.update(directory / name for name in _FINGERPRINT_CONFIG_FILES)
+    cargo_home = Path(os.environ.get("CARGO_HOME", Path.home() / ".cargo"))
+    files.update((cargo_home / "config", cargo_home / "config.toml"))
+    
+    for path in sorted(files):
+        if not path.is_file():
+            continue
+        update(str(path).encode())
+        update(path.read_bytes())
+    
+    return hasher.hexdigest()
+
+
+def _cached_elf(record_path: Path, fingerprint: str) -> Optional[Path]:
+    """
+    Return the ELF recorded at record_path if it was built from sources with
+    this fingerprint and has not been touched since, else None.
+    """
+    try:
+        record = json.loads(record_path.read_text())
+        if record["fingerprint"] != fingerprint:
+            return None
+        elf_path = Path(record["elf"])
+        stat = elf_path.stat()
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if (stat.st_size, stat.st_mtime_ns) != (record["size"], record["mtime_ns"]):
+        return None
+    return elf_path
+
+
+def _write_build_record(record_path: Path, fingerprint: str, elf_path: Path) -> None:
+    """Record which ELF the sources with this fingerprint produced."""
+    stat = elf_path.stat()
+    record = {"fingerprint": fingerprint, "elf": str(elf_path),
+              "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    record_path.parent.mkdir(parents=True, exist_ok=True)
+    record_path.write_text(json.dumps(record))
+
+
+@lru_cache(maxsize=32)
+def _manifest_binary_name(cargo_toml: str, mtime_ns: int) -> Optional[str]:
+    """
+    Return the binary name declared by a Cargo.toml, or None. Cached on
+    (path, mtime) so repeated builds skip the parse until the file changes.
+    """
+    # Parse Cargo.toml to get package name or bin name
+    import tomllib
+    with open(cargo_toml, "rb") as f:
+        cargo_data = tomllib.load(f)
+    
+    # Check for [[bin]] entries first
+    if "bin" in cargo_data and cargo_data["bin"]:
+        binary_name = cargo_data["bin"][0].get("name")
+        if binary_name is not None:
+            return binary_name
+    
+    # Fall back to package name; Cargo uses it as-is for the binary name
+    return cargo_data.get("package", {}).get("name") or None
+
+
+def _direct_elf_path(cargo_target: Path, binary_name: str) -> Path:
+    """Default direct-build ELF path: <target>/riscv32im-risc0-zkvm-elf/release/<binary>."""
+    return cargo_target / "riscv32im-risc0-zkvm-elf" / "release" / binary_name
+
+
+def _detect_embed_methods(guest_path: Path) -> bool:
+    """Return True if the guest's parent crate builds it via embed_methods."""
+    # Check if parent directory has build.rs with embed_methods
+    parent_build_rs = guest_path.parent / "build.rs"
+    
+    if parent_build_rs.exists():
+        # Byte search; no need to decode build.rs as text
+        return b"embed_methods" in parent_build_rs.read_bytes()
+    return False
+
+
+def _echo_line(line: bytes, tail: deque) -> None:
+    """Print one line of cargo output and remember it for error messages."""
+    print(line.decode('utf-8', errors='replace'), end="", flush=True)
+    tail.append(line.rstrip())
+
+
+def _echo_lines(pipe, tail: deque) -> None:
+    """Echo every line from pipe (run in a thread for cargo's stderr)."""
+    for line in pipe:
+        _echo_line(line, tail)
+
+
 def build_guest(
     guest_dir: str | Path,
     binary_name: Optional[str] = None,
-    use_embed_methods: Optional[bool] = None
+    use_embed_methods: Optional[bool] = None,
+    use_cache: bool = True,
+    clean: bool = False,
+    jobs: Optional[int] = None
 ) -> Path:
     """
     Build a RISC Zero guest program and return the path to the ELF file.
@@ -40,6 +241,14 @@ def build_guest(
     Always builds in release mode for optimal performance. Debug builds are not
     supported as they cause 100-1000x performance degradation with RISC Zero.
     
+    With use_cache, a SHA-256 fingerprint of everything outside the target
+    directory that decides the ELF (local package sources and manifests,
+    Cargo.lock, cargo config and toolchain files, CARGO*/RUST*/RISC0*
+    environment variables and the rustc versions) is recorded after each
+    build. A later call whose fingerprint matches, and whose recorded ELF is
+    untouched, returns that ELF without running cargo build. Otherwise cargo
+    rebuilds incrementally from its existing target directory.
+    
     This function handles both build methods:
     1. Standard RISC Zero structure with embed_methods (host/guest setup)
     2. Direct guest build (standalone guest)
@@ -49,6 +258,12 @@ def build_guest(
         binary_name: Name of the binary to build (defaults to package name from Cargo.toml)
         use_embed_methods: If True, use standard structure; if False, use direct build;
                           if None, auto-detect based on presence of build.rs in parent
+        use_cache: If True, skip cargo build when the fingerprint matches the last
+                   build; if False, always run cargo
+        clean: If True, delete previous build artifacts first and rebuild from
+               scratch (the fingerprint is not checked, but is recorded)
+        jobs: Number of parallel cargo jobs (defaults to cargo's own setting,
+              one per CPU); lower it to bound memory use on small machines
         
     Returns:
         Path to the built ELF file
@@ -70,37 +285,13 @@ def build_guest(
     
     # Determine binary name if not provided
     if binary_name is None:
-        # Parse Cargo.toml to get package name or bin name
-        import tomllib
-        with open(cargo_toml, "rb") as f:
-            cargo_data = tomllib.load(f)
-        
-        # Check for [[bin]] entries first
-        if "bin" in cargo_data and cargo_data["bin"]:
-            binary_name = cargo_data["bin"][0].get("name")
-        
-        # Fall back to package name
+        binary_name = _manifest_binary_name(str(cargo_toml), cargo_toml.stat().st_mtime_ns)
         if binary_name is None:
-            package_name = cargo_data.get("package", {}).get("name")
-            if package_name:
-                # Cargo uses the package name as-is for the binary name
-                binary_name = package_name
-            else:
-                raise InvalidGuestDirectoryError(f"Could not determine binary name from {cargo_toml}")
+            raise InvalidGuestDirectoryError(f"Could not determine binary name from {cargo_toml}")
     
     # Auto-detect build method if not specified
     if use_embed_methods is None:
-        # Check if parent directory has build.rs with embed_methods
-        parent_dir = guest_path.parent
-        parent_build_rs = parent_dir / "build.rs"
-        
-        if parent_build_rs.exists():
-            # Check if build.rs contains embed_methods
-            with open(parent_build_rs, "r") as f:
-                build_content = f.read()
-                use_embed_methods = "embed_methods" in build_content
-        else:
-            use_embed_methods = False
+        use_embed_methods = _detect_embed_methods(guest_path)
     
     # Calculate expected ELF path based on build method
     if use_embed_methods:
@@ -110,38 +301,60 @@ def build_guest(
         host_crate_name = guest_path.parent.name
         guest_crate_name = guest_path.name
         
-        # Look for target directory in workspace root or parent directories
-        search_dir = guest_path.parent
-        while search_dir != search_dir.parent:  # Stop at filesystem root
-            potential_target = search_dir / "target" / "riscv-guest"
-            if potential_target.exists() or search_dir / "Cargo.lock" in search_dir.iterdir():
-                workspace_root = search_dir
-                break
-            search_dir = search_dir.parent
+        # Ask cargo for the host crate's workspace root
+        metadata = _cargo_metadata(guest_path.parent)
+        if "workspace_root" in metadata:
+            workspace_root = Path(metadata["workspace_root"])
+        else:
+            # Look for target directory in workspace root or parent directories
+            search_dir = guest_path.parent
+            while search_dir != search_dir.parent:  # Stop at filesystem root
+                if (search_dir / "target" / "riscv-guest").exists() or (search_dir / "Cargo.lock").exists():
+                    workspace_root = search_dir
+                    break
+                search_dir = search_dir.parent
         
-        target_base = workspace_root / "target" / "riscv-guest" / host_crate_name / guest_crate_name
+        # Honour CARGO_TARGET_DIR / build.target-dir when cargo reports them
+        cargo_target = Path(metadata.get("target_directory", workspace_root / "target"))
+        target_base = cargo_target / "riscv-guest" / host_crate_name / guest_crate_name
         target_dir = target_base / "riscv32im-risc0-zkvm-elf"
+        # Always use release mode for RISC Zero guests
+        elf_path: Optional[Path] = target_dir / "release" / binary_name
     else:
-        # Direct build: <guest_dir>/target/riscv32im-risc0-zkvm-elf/release/<binary>
-        target_dir = guest_path / "target" / "riscv32im-risc0-zkvm-elf"
+        # Direct build: cargo reports the ELF path in its artifact records
+        metadata = {}
+        elf_path = None
     
-    # Always use release mode for RISC Zero guests
-    elf_path = target_dir / "release" / binary_name
+    # Fingerprint before building, so edits made while cargo runs miss next time
+    fingerprint: Optional[str] = None
+    if use_cache:
+        build_dir = guest_path.parent if use_embed_methods else guest_path
+        guest_metadata = _cargo_metadata(guest_path, no_deps=False)
+        metadatas = [metadata, guest_metadata] if use_embed_methods else [guest_metadata]
+        fingerprint = _build_fingerprint(binary_name, build_dir, metadatas)
+    if fingerprint is not None:
+        # Read and written at the expected ELF path, wherever cargo puts it
+        expected_elf = elf_path or _direct_elf_path(Path(guest_metadata["target_directory"]), binary_name)
+        record_path = expected_elf.with_name(expected_elf.name + ".fingerprint")
+        cached_elf = None if clean else _cached_elf(record_path, fingerprint)
+        if cached_elf is not None:
+            print(f"✓ Guest program up to date: {cached_elf}")
+            return cached_elf
     
-    # Always clean build artifacts to ensure fresh build
-    if use_embed_methods:
+    # Only clean on request; otherwise let cargo rebuild what changed
+    if clean and use_embed_methods:
         # For standard builds, clean from workspace target
-        clean_dir = workspace_root / "target" / "riscv-guest"
+        clean_dir = cargo_target / "riscv-guest"
         if clean_dir.exists():
             shutil.rmtree(clean_dir, ignore_errors=True)
             print(f"Cleaned build cache: {clean_dir}")
-    else:
+    elif clean:
         # For direct builds, run cargo clean in the guest directory
         clean_result = subprocess.run(
             ["cargo", "clean"],
             cwd=guest_path,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=False
         )
         if clean_result.returncode == 0:
@@ -162,25 +375,52 @@ def build_guest(
         cmd = [
             "cargo", "+risc0", "build",
             "--target", "riscv32im-risc0-zkvm-elf",
-            "--release"
+            "--release",
+            # JSON artifact records on stdout, human diagnostics on stderr
+            "--message-format=json-render-diagnostics"
         ]
     
+    env = None
+    if jobs is not None:
+        cmd += ["--jobs", str(jobs)]
+        # The env var also reaches the nested guest build run by embed_methods
+        env = {**os.environ, "CARGO_BUILD_JOBS": str(jobs)}
+    
+    # Executable path reported by cargo itself (direct builds only)
+    built_executable: Optional[Path] = None
+    
     try:
-        result = subprocess.run(
+        # Stream cargo's output while it builds; only the tail is kept for errors
+        tail: deque[bytes] = deque(maxlen=10)
+        with subprocess.Popen(
             cmd,
             cwd=build_dir,
-            capture_output=True,
-            text=True,
-            check=False
-        )
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        ) as proc:
+            stderr_reader = Thread(target=_echo_lines, args=(proc.stderr, tail), daemon=True)
+            stderr_reader.start()
+            for line in proc.stdout:
+                if not use_embed_methods and line.startswith(b"{"):
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        _echo_line(line, tail)
+                        continue
+                    if (message.get("reason") == "compiler-artifact"
+                            and message.get("executable")
+                            and message["target"]["name"] == binary_name):
+                        built_executable = Path(message["executable"])
+                    continue
+                _echo_line(line, tail)
+            stderr_reader.join()
         
-        if result.returncode != 0:
-            error_msg = f"Guest build failed with exit code {result.returncode}"
-            if result.stderr:
-                # Extract relevant error lines
-                stderr_lines = result.stderr.strip().split('\n')
-                # Show last 10 lines of error
-                relevant_errors = '\n'.join(stderr_lines[-10:])
+        if proc.returncode != 0:
+            error_msg = f"Guest build failed with exit code {proc.returncode}"
+            if tail:
+                # Show last 10 lines of output
+                relevant_errors = b'\n'.join(tail).decode('utf-8', errors='replace')
                 error_msg += f"\n\nBuild errors:\n{relevant_errors}"
             raise GuestBuildFailedError(error_msg)
             
@@ -189,6 +429,14 @@ def build_guest(
     except subprocess.SubprocessError as e:
         raise GuestBuildFailedError(f"Failed to run cargo build: {e}")
     
+    # Trust cargo's own record of where the binary went
+    if built_executable is not None:
+        elf_path = built_executable
+    elif elf_path is None:
+        # No artifact record; fall back to the default direct-build layout
+        cargo_target = Path(_cargo_metadata(guest_path).get("target_directory", guest_path / "target"))
+        elf_path = _direct_elf_path(cargo_target, binary_name)
+    
     # Verify ELF was created
     if not elf_path.exists():
         # Provide helpful error information
@@ -200,10 +448,11 @@ def build_guest(
                 f"This suggests the build didn't produce any output."
             )
         
-        # List what files ARE in the directory
-        existing_files = list(parent_dir.glob("*"))
+        # List (up to 10 of) the files that ARE in the directory
+        with os.scandir(parent_dir) as entries:
+            existing_files = [entry.name for entry in islice(entries, 10)]
         if existing_files:
-            files_list = "\n  ".join(str(f.name) for f in existing_files[:10])
+            files_list = "\n  ".join(existing_files)
             raise ElfNotFoundError(
                 f"ELF not found at expected path: {elf_path}\n"
                 f"Expected binary name: {binary_name}\n"
@@ -217,9 +466,69 @@ def build_guest(
                 f"The build may have failed silently."
             )
     
+    if fingerprint is not None:
+        _write_build_record(record_path, fingerprint, elf_path)
+    
     print(f"✓ Guest program built successfully: {elf_path}")
     print(f"  Size: {os.path.getsize(elf_path):,} bytes")
     
     return elf_path
 
 
+def build_guests(
+    guest_dirs: Iterable[str | Path],
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+    clean: bool = False,
+    jobs: Optional[int] = None
+) -> List[Path]:
+    """
+    Build several RISC Zero guest programs concurrently.
+    
+    Each guest is built with build_guest() (binary name auto-detected from its
+    Cargo.toml). The work happens in cargo subprocesses, so independent guests
+    are built in parallel threads. Guests built through the same host crate
+    (embed_methods) share a target directory and are built one after another.
+    
+    Args:
+        guest_dirs: Paths to guest directories containing Cargo.toml
+        max_workers: Maximum number of concurrent builds (defaults to the
+                     ThreadPoolExecutor default)
+        use_cache: Passed to build_guest for every guest
+        clean: Passed to build_guest for every guest
+        jobs: Passed to build_guest for every guest (cargo jobs per build)
+    
+    Returns:
+        Paths to the built ELF files, in the same order as guest_dirs
+    
+    Raises:
+        The first BuildError to be raised by any of the builds. Builds that
+        have not started yet are cancelled; builds already running are left
+        to finish (cargo is not interrupted) before the error propagates.
+    """
+    guest_paths = [Path(d).resolve() for d in guest_dirs]
+    
+    # Group guests that build into the same target directory
+    groups: dict[Path, List[int]] = {}
+    for index, guest_path in enumerate(guest_paths):
+        shared = (guest_path / "Cargo.toml").exists() and _detect_embed_methods(guest_path)
+        key = guest_path.parent if shared else guest_path
+        groups.setdefault(key, []).append(index)
+    
+    elf_paths: List[Optional[Path]] = [None] * len(guest_paths)
+    
+    def build_group(indices: List[int]) -> None:
+        for index in indices:
+            elf_paths[index] = build_guest(guest_paths[index], use_cache=use_cache, clean=clean, jobs=jobs)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(build_group, indices) for indices in groups.values()]
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is not None:
+                # Don't start groups still waiting for a worker
+                for pending in futures:
+                    pending.cancel()
+                raise error
+    
+    return elf_paths
@@ -0,0 +1,59 @@
+"""
+Cached image loading for PyR0.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+
+from pyr0._rust import Image, load_image
+
+
+# Enough for every guest a test run or host application typically loads
+_MAX_CACHED_IMAGES = 32
+
+
+@lru_cache(maxsize=_MAX_CACHED_IMAGES)
+def _load_path(path: str, size: int, mtime_ns: int) -> Image:
+    # size and mtime_ns are only part of the key: a rebuilt ELF misses
+    return load_image(path)
+
+
+@lru_cache(maxsize=_MAX_CACHED_IMAGES)
+def _load_bytes(elf: bytes) -> Image:
+    return load_image(elf)
+
+
+def load_image_cached(elf: Union[str, os.PathLike, bytes, bytearray, memoryview]) -> Image:
+    """
+    Load an ELF like load_image(), reusing the Image from an earlier call
+    with the same ELF instead of parsing it and computing its ID again.
+
+    Paths are keyed on the resolved path, file size and modification time,
+    so rebuilding the guest loads the new ELF. Bytes-like objects are keyed
+    on their contents (the cache keeps a copy of each).
+
+    The same Image object is returned to every caller. Images have no
+    mutating methods, so sharing them is safe.
+
+    Args:
+        elf: Path to an ELF file, or the ELF contents
+
+    Returns:
+        The loaded Image
+
+    Raises:
+        ValueError: If the ELF cannot be loaded
+    """
+    if isinstance(elf, (str, os.PathLike)):
+        path = Path(elf).resolve()
+        stat = path.stat()
+        return _load_path(str(path), stat.st_size, stat.st_mtime_ns)
+    return _load_bytes(elf if isinstance(elf, bytes) else bytes(elf))
+
+
+def clear_image_cache() -> None:
+    """Drop every Image held by load_image_cached()."""
+    _load_path.cache_clear()
+    _load_bytes.cache_clear()
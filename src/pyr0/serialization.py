@@ -14,6 +14,46 @@ import struct
 from typing import Union, List
 
 
+# Precompiled little-endian integer formats (skip format parsing per call)
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+
+
+def _as_bytes(data) -> bytes:
+    """Coerce bytes-like data or a list of integers (0-255) to bytes."""
+    if isinstance(data, bytes):
+        return data
+    if hasattr(data, 'tobytes'):  # numpy arrays, array.array, memoryview
+        return data.tobytes()
+    # bytearray, list, tuple and other buffer-protocol objects
+    return bytes(data)
+
+
+def _as_buffer(data) -> Union[bytes, bytearray, memoryview]:
+    """
+    Like _as_bytes, but pass bytearrays and flat byte buffers (memoryview,
+    uint8 numpy arrays, array.array('B')) through uncopied, for callers
+    that copy the data into their own output anyway.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return data
+    try:
+        view = memoryview(data)
+    except TypeError:  # lists, tuples and other non-buffer objects
+        return _as_bytes(data)
+    if view.ndim == 1 and view.format == 'B' and view.c_contiguous:
+        return view
+    return _as_bytes(data)
+
+
+def _fixed_buffer(data, size: int) -> Union[bytes, bytearray, memoryview]:
+    """Return data as a buffer of exactly size bytes, else raise ValueError."""
+    data = _as_buffer(data)
+    if len(data) != size:
+        raise ValueError(f"Expected exactly {size} bytes, got {len(data)}")
+    return data
+
+
 def to_vec_u8(data: Union[bytes, bytearray, List[int]]) -> bytes:
     """
     Serialize data as Rust Vec<u8> for RISC Zero's serde format.
@@ -35,25 +75,16 @@ def to_vec_u8(data: Union[bytes, bytearray, List[int]]) -> bytes:
         >>> to_vec_u8(b"AB")  # 2 bytes
         # Results in: length(2) + A as u32 + B as u32 = 12 bytes total
     """
-    if isinstance(data, (list, tuple)):
-        data = bytes(data)
-    elif isinstance(data, bytearray):
-        data = bytes(data)
-    elif not isinstance(data, bytes):
-        # Try to convert other types
-        if hasattr(data, 'tobytes'):  # numpy arrays, array.array
-            data = data.tobytes()
-        else:
-            data = bytes(data)
-    
-    # Pack length as u32
-    result = struct.pack('<I', len(data))
+    data = _as_buffer(data)
     
-    # Pack each byte as a u32 word (little-endian)
-    for byte in data:
-        result += struct.pack('<I', byte)
+    # Length word followed by each byte in the low byte of its own
+    # little-endian u32 word; the strided slice assignment widens every
+    # byte in one C-level copy instead of a per-byte pack/concat loop.
+    result = bytearray(4 * (len(data) + 1))
+    _U32.pack_into(result, 0, len(data))
+    result[4::4] = data
     
-    return result
+    return bytes(result)
 
 
 def to_bytes32(data: Union[bytes, bytearray, List[int]]) -> bytes:
@@ -71,20 +102,7 @@ def to_bytes32(data: Union[bytes, bytearray, List[int]]) -> bytes:
     Raises:
         ValueError: If data is not exactly 32 bytes
     """
-    if isinstance(data, (list, tuple)):
-        data = bytes(data)
-    elif isinstance(data, bytearray):
-        data = bytes(data)
-    elif not isinstance(data, bytes):
-        if hasattr(data, 'tobytes'):
-            data = data.tobytes()
-        else:
-            data = bytes(data)
-    
-    if len(data) != 32:
-        raise ValueError(f"Expected exactly 32 bytes, got {len(data)}")
-    
-    return data
+    return bytes(_fixed_buffer(data, 32))
 
 
 def to_bytes64(data: Union[bytes, bytearray, List[int]]) -> bytes:
@@ -102,20 +120,7 @@ def to_bytes64(data: Union[bytes, bytearray, List[int]]) -> bytes:
     Raises:
         ValueError: If data is not exactly 64 bytes
     """
-    if isinstance(data, (list, tuple)):
-        data = bytes(data)
-    elif isinstance(data, bytearray):
-        data = bytes(data)
-    elif not isinstance(data, bytes):
-        if hasattr(data, 'tobytes'):
-            data = data.tobytes()
-        else:
-            data = bytes(data)
-    
-    if len(data) != 64:
-        raise ValueError(f"Expected exactly 64 bytes, got {len(data)}")
-    
-    return data
+    return bytes(_fixed_buffer(data, 64))
 
 
 def to_u32(value: int) -> bytes:
@@ -133,7 +138,7 @@ def to_u32(value: int) -> bytes:
     Raises:
         struct.error: If value is out of range for u32
     """
-    return struct.pack('<I', value)
+    return _U32.pack(value)
 
 
 def to_u64(value: int) -> bytes:
@@ -151,7 +156,7 @@ def to_u64(value: int) -> bytes:
     Raises:
         struct.error: If value is out of range for u64
     """
-    return struct.pack('<Q', value)
+    return _U64.pack(value)
 
 
 def to_string(text: str) -> bytes:
@@ -167,7 +172,7 @@ def to_string(text: str) -> bytes:
         Serialized string with length prefix
     """
     encoded = text.encode('utf-8')
-    return struct.pack('<Q', len(encoded)) + encoded
+    return _U64.pack(len(encoded)) + encoded
 
 
 def to_bool(value: bool) -> bytes:
@@ -204,17 +209,7 @@ def raw_bytes(data: Union[bytes, bytearray, List[int]]) -> bytes:
         >>> raw_bytes(b"hello")
         b'hello'  # Just 5 bytes, no length prefix
     """
-    if isinstance(data, (list, tuple)):
-        data = bytes(data)
-    elif isinstance(data, bytearray):
-        data = bytes(data)
-    elif not isinstance(data, bytes):
-        if hasattr(data, 'tobytes'):
-            data = data.tobytes()
-        else:
-            data = bytes(data)
-    
-    return data
+    return _as_bytes(data)
 
 
 # ============================================================================
@@ -242,17 +237,20 @@ def ed25519_input(public_key: bytes, signature: bytes, message: bytes) -> bytes:
         input_data = ed25519_input(pk_bytes, sig_bytes, msg_bytes)
         receipt = pyr0.prove(image, input_data)
     """
-    return to_vec_u8(public_key) + to_vec_u8(signature) + to_vec_u8(message)
+    return b"".join((to_vec_u8(public_key), to_vec_u8(signature), to_vec_u8(message)))
 
 
 def ed25519_input_arrays(public_key: bytes, signature: bytes, message: bytes) -> bytes:
     """
     Serialize Ed25519 verification input with fixed arrays for key and signature.
-    More efficient than Vec<u8> for fixed-size data.
+    More efficient than Vec<u8> for fixed-size data: the key and signature
+    are sent as 96 raw bytes instead of 388 bytes of u32 words.
     
     Guest code would read this as:
-        let public_key: [u8; 32] = env::read();
-        let signature: [u8; 64] = env::read();
+        let mut public_key = [0u8; 32];
+        env::read_slice(&mut public_key);
+        let mut signature = [0u8; 64];
+        env::read_slice(&mut signature);
         let message: Vec<u8> = env::read();
     
     Args:
@@ -267,7 +265,8 @@ def ed25519_input_arrays(public_key: bytes, signature: bytes, message: bytes) ->
         input_data = ed25519_input_arrays(pk_bytes, sig_bytes, msg_bytes)
         receipt = pyr0.prove(image, input_data)
     """
-    return to_bytes32(public_key) + to_bytes64(signature) + to_vec_u8(message)
+    # join copies the key and signature straight from the caller's buffers
+    return b"".join((_fixed_buffer(public_key, 32), _fixed_buffer(signature, 64), to_vec_u8(message)))
 
 
 
@@ -11,7 +11,7 @@ def to_u64(value: int) -> bytes:
     """Serialize u64 for env::read() (8 bytes, little-endian)."""
     ...
 
-def to_vec_u8(data: Union[bytes, bytearray]) -> bytes:
+def to_vec_u8(data: Union[bytes, bytearray, memoryview]) -> bytes:
     """Serialize Vec<u8> with u64 length prefix for env::read()."""
     ...
 
@@ -24,23 +24,23 @@ def to_bool(value: bool) -> bytes:
     ...
 
 # For env::read_slice() - raw bytes
-def to_bytes32(data: Union[bytes, bytearray]) -> bytes:
+def to_bytes32(data: Union[bytes, bytearray, memoryview]) -> bytes:
     """Ensure exactly 32 bytes for env::read_slice() with [u8; 32]."""
     ...
 
-def to_bytes64(data: Union[bytes, bytearray]) -> bytes:
+def to_bytes64(data: Union[bytes, bytearray, memoryview]) -> bytes:
     """Ensure exactly 64 bytes for env::read_slice() with [u8; 64]."""
     ...
 
-def raw_bytes(data: Union[bytes, bytearray]) -> bytes:
+def raw_bytes(data: Union[bytes, bytearray, memoryview]) -> bytes:
     """Pass through raw bytes for env::read_slice()."""
     ...
 
 # Convenience functions
 def ed25519_input(
-    public_key: Union[bytes, bytearray],
-    signature: Union[bytes, bytearray],
-    message: Union[bytes, bytearray]
+    public_key: Union[bytes, bytearray, memoryview],
+    signature: Union[bytes, bytearray, memoryview],
+    message: Union[bytes, bytearray, memoryview]
 ) -> bytes:
     """
     Create input for Ed25519 signature verification guest.
@@ -53,4 +53,23 @@ def ed25519_input(
     Returns:
         Serialized input for the guest program
     """
-    ...
\ No newline at end of file
+    ...
+
+def ed25519_input_arrays(
+    public_key: Union[bytes, bytearray, memoryview],
+    signature: Union[bytes, bytearray, memoryview],
+    message: Union[bytes, bytearray, memoryview]
+) -> bytes:
+    """
+    Create input for an Ed25519 guest that reads the key and signature
+    with env::read_slice() and the message with env::read().
+    
+    Args:
+        public_key: 32-byte Ed25519 public key
+        signature: 64-byte Ed25519 signature
+        message: Variable-length message that was signed
+    
+    Returns:
+        Serialized input for the guest program
+    """
+    ...
@@ -1,5 +1,6 @@
 use pyo3::prelude::*;
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::types::PyBytes;
 
 use risc0_zkvm::{
     Receipt as RiscZeroReceipt,
@@ -7,7 +8,9 @@ use risc0_zkvm::{
     ExitCode as RiscZeroExitCode,
 };
 use risc0_zkvm::sha::{Digest, Digestible};
+use std::sync::OnceLock;
 use crate::claim::Claim;
+use crate::buffer::with_bytes;
 
 /// Kind of receipt/proof
 #[pyclass(module = "pyr0", eq, eq_int)]
@@ -71,12 +74,90 @@ impl ExitStatus {
 #[derive(Clone)]
 pub struct Receipt {
     pub inner: RiscZeroReceipt,
+    // First image ID this receipt passed full verification against. Receipts
+    // are immutable, so verifying again for that ID can be skipped.
+    verified_image_id: OnceLock<Digest>,
 }
 
 impl Receipt {
     pub fn from_risc0(receipt: RiscZeroReceipt) -> Self {
-        Self { inner: receipt }
+        Self { inner: receipt, verified_image_id: OnceLock::new() }
     }
+    
+    /// Full verification: checks seal, image ID match, and success exit
+    /// 
+    /// A receipt that already verified against `image_id` (the first ID it
+    /// passed against) returns at once.
+    pub(crate) fn verify_once(&self, image_id: Digest) -> anyhow::Result<()> {
+        if self.verified_image_id.get() == Some(&image_id) {
+            return Ok(());
+        }
+        self.inner.verify(image_id)?;
+        let _ = self.verified_image_id.set(image_id);
+        Ok(())
+    }
+    
+    /// verify_once for the Python methods, with the GIL released
+    fn verify_digest(&self, py: Python<'_>, image_id: Digest) -> PyResult<()> {
+        py.allow_threads(|| self.verify_once(image_id))
+            .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("Verification failed: {e}")))
+    }
+}
+
+/// Parse an image ID given as a hex string (with or without 0x prefix)
+fn digest_from_hex(image_id_hex: &str) -> PyResult<Digest> {
+    // Handle optional 0x prefix
+    let hex_str = image_id_hex.strip_prefix("0x")
+        .or_else(|| image_id_hex.strip_prefix("0X"))
+        .unwrap_or(image_id_hex);
+    
+    // Decode straight into the digest's 32 bytes - no intermediate Vec
+    let mut bytes = [0u8; 32];
+    hex::decode_to_slice(hex_str, &mut bytes).map_err(|e| match e {
+        hex::FromHexError::InvalidStringLength => PyErr::new::<PyValueError, _>(
+            format!("Image ID must be 32 bytes (64 hex chars), got {} bytes", hex_str.len() / 2)
+        ),
+        e => PyErr::new::<PyValueError, _>(format!("Invalid hex string: {e}")),
+    })?;
+    
+    Ok(Digest::from_bytes(bytes))
+}
+
+/// Parse an image ID given as exactly 32 bytes
+fn digest_from_bytes(image_id: &[u8]) -> PyResult<Digest> {
+    if image_id.len() != 32 {
+        return Err(PyErr::new::<PyValueError, _>(
+            format!("Image ID must be 32 bytes, got {} bytes", image_id.len())
+        ));
+    }
+    
+    Digest::try_from(image_id)
+        .map_err(|_| PyErr::new::<PyValueError, _>("Failed to create digest from bytes"))
+}
+
+/// Parse a trusted image ID given as bytes, hex string or Image object
+/// (the forms accepted by Receipt.verify)
+pub(crate) fn image_id_digest(image_id: &Bound<'_, PyAny>) -> PyResult<Digest> {
+    use crate::image::Image;
+    
+    // Try to extract as Image first
+    if let Ok(image) = image_id.extract::<PyRef<Image>>() {
+        return digest_from_bytes(&image.id()?);
+    }
+    
+    // Try as string (hex)
+    if let Ok(hex_str) = image_id.extract::<String>() {
+        return digest_from_hex(&hex_str);
+    }
+    
+    // Try as bytes (or any bytes-like object), read in place
+    if let Ok(digest) = with_bytes(image_id, digest_from_bytes) {
+        return digest;
+    }
+    
+    Err(PyErr::new::<PyValueError, _>(
+        "image_id must be bytes (32 bytes), hex string (64 chars), or Image object"
+    ))
 }
 
 #[pymethods]
@@ -85,8 +166,9 @@ impl Receipt {
     
     /// Raw journal bytes as emitted by the guest
     #[getter]
-    pub fn journal_bytes(&self) -> PyResult<Vec<u8>> {
-        Ok(self.inner.journal.bytes.clone())
+    pub fn journal_bytes<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        // Copy straight into a Python bytes object, no intermediate Vec
+        PyBytes::new(py, &self.inner.journal.bytes)
     }
     
     /// Journal as hex string (useful for logging/transport)
@@ -98,7 +180,7 @@ impl Receipt {
     /// UTF-8 decode of journal if valid, otherwise None
     #[getter]
     pub fn journal_text(&self) -> PyResult<Option<String>> {
-        Ok(String::from_utf8(self.inner.journal.bytes.clone()).ok())
+        Ok(std::str::from_utf8(&self.inner.journal.bytes).ok().map(str::to_owned))
     }
     
     /// Length of the journal in bytes
@@ -109,8 +191,8 @@ impl Receipt {
     
     // Legacy getter for backward compatibility
     #[getter]
-    pub fn journal(&self) -> PyResult<Vec<u8>> {
-        self.journal_bytes()
+    pub fn journal<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        self.journal_bytes(py)
     }
     
     // ===== Claim (what this receipt proves) =====
@@ -300,31 +382,8 @@ impl Receipt {
     /// Raises:
     ///     ValueError: If hex string is invalid format
     ///     RuntimeError: If verification fails
-    pub fn verify_hex(&self, image_id_hex: &str) -> PyResult<()> {
-        // Handle optional 0x prefix
-        let hex_str = if image_id_hex.starts_with("0x") || image_id_hex.starts_with("0X") {
-            &image_id_hex[2..]
-        } else {
-            image_id_hex
-        };
-        
-        // Decode hex to bytes
-        let bytes = hex::decode(hex_str)
-            .map_err(|e| PyErr::new::<PyValueError, _>(format!("Invalid hex string: {e}")))?;
-        
-        if bytes.len() != 32 {
-            return Err(PyErr::new::<PyValueError, _>(
-                format!("Image ID must be 32 bytes (64 hex chars), got {} bytes", bytes.len())
-            ));
-        }
-        
-        // Convert to Digest and verify
-        let image_id = Digest::try_from(bytes.as_slice())
-            .map_err(|_| PyErr::new::<PyValueError, _>("Failed to create digest from bytes"))?;
-        
-        // Full verification: checks seal, image ID match, and success exit
-        self.inner.verify(image_id)
-            .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("Verification failed: {e}")))
+    pub fn verify_hex(&self, py: Python<'_>, image_id_hex: &str) -> PyResult<()> {
+        self.verify_digest(py, digest_from_hex(image_id_hex)?)
     }
     
     /// Verify the receipt with a trusted image ID provided as bytes
@@ -335,18 +394,8 @@ impl Receipt {
     /// Raises:
     ///     ValueError: If bytes are not exactly 32 bytes
     ///     RuntimeError: If verification fails
-    pub fn verify_bytes(&self, image_id: Vec<u8>) -> PyResult<()> {
-        if image_id.len() != 32 {
-            return Err(PyErr::new::<PyValueError, _>(
-                format!("Image ID must be 32 bytes, got {} bytes", image_id.len())
-            ));
-        }
-        
-        let digest = Digest::try_from(image_id.as_slice())
-            .map_err(|_| PyErr::new::<PyValueError, _>("Failed to create digest from bytes"))?;
-        
-        self.inner.verify(digest)
-            .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("Verification failed: {e}")))
+    pub fn verify_bytes(&self, py: Python<'_>, image_id: &Bound<'_, PyAny>) -> PyResult<()> {
+        self.verify_digest(py, with_bytes(image_id, digest_from_bytes)??)
     }
     
     /// Check if the receipt has a valid claim structure.
@@ -389,26 +438,7 @@ impl Receipt {
     ///     receipt.verify("0xabc123...")               # hex string
     ///     receipt.verify(image)                        # Image object
     pub fn verify(&self, image_id: &Bound<'_, PyAny>) -> PyResult<()> {
-        use crate::image::Image;
-        
-        // Try to extract as Image first
-        if let Ok(image) = image_id.extract::<PyRef<Image>>() {
-            return self.verify_bytes(image.id()?);
-        }
-        
-        // Try as string (hex)
-        if let Ok(hex_str) = image_id.extract::<String>() {
-            return self.verify_hex(&hex_str);
-        }
-        
-        // Try as bytes
-        if let Ok(bytes) = image_id.extract::<Vec<u8>>() {
-            return self.verify_bytes(bytes);
-        }
-        
-        Err(PyErr::new::<PyValueError, _>(
-            "image_id must be bytes (32 bytes), hex string (64 chars), or Image object"
-        ))
+        self.verify_digest(image_id.py(), image_id_digest(image_id)?)
     }
     
     /// Deprecated: Use verify() instead
@@ -420,17 +450,20 @@ impl Receipt {
     // ===== Serialization =====
     
     /// Serialize the receipt to bytes for storage/transport
-    pub fn to_bytes(&self) -> PyResult<Vec<u8>> {
-        bincode::serialize(&self.inner)
-            .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("Failed to serialize receipt: {e}")))
+    pub fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        // One encoding pass; sizing it first would walk the seal twice
+        let data = bincode::serialize(&self.inner)
+            .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("Failed to serialize receipt: {e}")))?;
+        Ok(PyBytes::new(py, &data))
     }
     
-    /// Deserialize a receipt from bytes
+    /// Deserialize a receipt from bytes (or any buffer-protocol object)
     #[staticmethod]
-    pub fn from_bytes(data: Vec<u8>) -> PyResult<Self> {
-        let inner: RiscZeroReceipt = bincode::deserialize(&data)
+    pub fn from_bytes(data: &Bound<'_, PyAny>) -> PyResult<Self> {
+        // Decode straight from the caller's buffer
+        let inner: RiscZeroReceipt = with_bytes(data, |bytes| bincode::deserialize(bytes))?
             .map_err(|e| PyErr::new::<PyValueError, _>(format!("Failed to deserialize receipt: {e}")))?;
-        Ok(Self { inner })
+        Ok(Self::from_risc0(inner))
     }
     
     // ===== String representation =====
@@ -23,9 +23,7 @@ def test_byte_equivalence():
         guest_dir = Path("test_cbor_guest")
         if guest_dir.exists():
             elf_path = pyr0.build_guest(guest_dir, "test-cbor-guest")
-            with open(elf_path, "rb") as f:
-                elf_data = f.read()
-            image = pyr0.load_image(elf_data)
+            image = pyr0.load_image(elf_path)
         else:
             print("  ⚠️ Skipping test - test guest not found")
             return True
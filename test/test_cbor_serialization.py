@@ -26,16 +26,13 @@ def test_cbor_serialization():
         try:
             elf_path = pyr0.build_guest(guest_dir, "test-cbor-guest")
             print(f"   ✓ Built guest: {elf_path}")
-            
-            with open(elf_path, "rb") as f:
-                elf_data = f.read()
         except (pyr0.GuestBuildFailedError, pyr0.ElfNotFoundError) as e:
             print(f"   ❌ Failed to build guest: {e}")
             return False
         
         # Load the image
         print("\n2. Loading guest image...")
-        image = pyr0.load_image(elf_data)
+        image = pyr0.load_image(elf_path)
         print(f"   ✓ Loaded image with ID: {image.id_hex[:16]}...")
         
         # Prepare test data - as a CBOR array to match Rust's numeric indices
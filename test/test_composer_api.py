@@ -5,7 +5,6 @@ This demonstrates the correct way to do composition in PyR0 v0.7.0.
 """
 
 import pyr0
-import struct
 import sys
 
 def test_composer_api():
@@ -17,11 +16,12 @@ def test_composer_api():
     
     # 1. Build and load the guests
     print("\n1. Building guest programs...")
-    inner_elf = pyr0.build_guest("test_inner_guest")
-    outer_elf = pyr0.build_guest("test_outer_guest")
+    # The guests are independent, so build them concurrently
+    inner_elf, outer_elf = pyr0.build_guests(["test_inner_guest", "test_outer_guest"])
     
-    inner_image = pyr0.load_image(open(inner_elf, 'rb').read())
-    outer_image = pyr0.load_image(open(outer_elf, 'rb').read())
+    # Cached, so test_claim_api reuses the inner image instead of reparsing it
+    inner_image = pyr0.load_image_cached(inner_elf)
+    outer_image = pyr0.load_image(outer_elf)
     
     print(f"Inner image ID: {inner_image.id.hex()[:16]}...")
     print(f"Outer image ID: {outer_image.id.hex()[:16]}...")
@@ -41,7 +41,7 @@ def test_composer_api():
     print(f"Exit code: {claim.exit_code} ({'success' if claim.is_success else 'failed'})")
     
     # Extract the sum from the journal
-    sum_value = struct.unpack('<I', claim.journal[:4])[0]
+    sum_value = int.from_bytes(claim.journal[:4], 'little')
     print(f"Inner computation: {a} + {b} = {sum_value}")
     
     # 4. Use the new Composer API for the outer proof
@@ -52,9 +52,9 @@ def test_composer_api():
     comp.assume(inner_receipt)
     print(f"Added {comp.assumption_count} assumption(s)")
     
-    # Write typed inputs for the outer guest
-    comp.write_u32(sum_value)              # Expected sum (4 bytes)
-    comp.write_image_id(inner_image.id)    # Inner image ID (32 bytes)
+    # Write typed inputs for the outer guest in one call:
+    # expected sum (u32, 4 bytes) and inner image ID (32 bytes)
+    comp.write_packed("I32s", sum_value, inner_image.id)
     print(f"Input buffer size: {comp.input_size} bytes")
     
     # Register what we expect the guest to verify (for preflight check)
@@ -84,7 +84,7 @@ def test_composer_api():
     outer_claim = outer_receipt.claim()
     
     # Extract result from outer journal
-    result = struct.unpack('<I', outer_claim.journal[:4])[0]
+    result = int.from_bytes(outer_claim.journal[:4], 'little')
     print(f"Outer computation: {sum_value} * 2 = {result}")
     
     # Verify the proof using the unified verify method
@@ -110,7 +110,7 @@ def test_claim_api():
     # Create a simple proof
     print("\n1. Creating a simple proof...")
     guest_elf = pyr0.build_guest("test_inner_guest")
-    image = pyr0.load_image(open(guest_elf, 'rb').read())
+    image = pyr0.load_image_cached(guest_elf)
     
     input_data = pyr0.serialization.to_u32(10) + pyr0.serialization.to_u32(20)
     receipt = pyr0.prove(image, input_data)
@@ -9,112 +9,13 @@ This demonstrates how to:
 """
 
 import pyr0
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import subprocess
 import sys
 
-def build_inner_guest():
-    """Build the inner guest that performs addition."""
-    inner_dir = Path("test_inner_guest")
-    
-    # Create inner guest if needed
-    if not inner_dir.exists():
-        print("Creating inner guest...")
-        inner_dir.mkdir()
-        
-        # Create Cargo.toml
-        (inner_dir / "Cargo.toml").write_text("""[package]
-name = "test-inner-guest"
-version = "0.1.0"
-edition = "2021"
-
-[dependencies]
-risc0-zkvm = { version = "1.2" }
-
-[workspace]
-""")
-        
-        # Create src/main.rs
-        src_dir = inner_dir / "src"
-        src_dir.mkdir()
-        (src_dir / "main.rs").write_text("""
-use risc0_zkvm::guest::env;
-
-fn main() {
-    // Read two numbers
-    let a: u32 = env::read();
-    let b: u32 = env::read();
-    
-    // Compute sum
-    let sum = a + b;
-    
-    // Commit the sum to the journal
-    env::commit(&sum);
-}
-""")
-        
-        # Build the guest
-        print("Building inner guest...")
-        subprocess.run(["cargo", "build", "--release"], cwd=inner_dir, check=True)
-    
-    # Build and return path
-    return pyr0.build_guest(inner_dir, release=True)
-
-def build_outer_guest():
-    """Build the outer guest that verifies the inner proof."""
-    outer_dir = Path("test_outer_guest")
-    
-    # Create outer guest if needed
-    if not outer_dir.exists():
-        print("Creating outer guest...")
-        outer_dir.mkdir()
-        
-        # Create Cargo.toml
-        (outer_dir / "Cargo.toml").write_text("""[package]
-name = "test-outer-guest"
-version = "0.1.0"
-edition = "2021"
-
-[dependencies]
-risc0-zkvm = { version = "1.2" }
-
-[workspace]
-""")
-        
-        # Create src/main.rs
-        src_dir = outer_dir / "src"
-        src_dir.mkdir()
-        (src_dir / "main.rs").write_text("""
-use risc0_zkvm::guest::env;
-
-fn main() {
-    // Read the expected sum from the inner proof
-    let expected_sum: u32 = env::read();
-    
-    // Read the image ID of the inner guest
-    let inner_image_id: [u8; 32] = env::read();
-    
-    // Create expected journal (inner guest commits a u32)
-    let expected_journal = risc0_zkvm::serde::to_vec(&expected_sum).unwrap();
-    
-    // Verify the assumption (inner proof)
-    // This will be checked when the outer proof is verified
-    env::verify(inner_image_id, &expected_journal).unwrap();
-    
-    // Do some additional computation with the verified sum
-    let result = expected_sum * 2;
-    
-    // Commit the result
-    env::commit(&result);
-}
-""")
-        
-        # Build the guest
-        print("Building outer guest...")
-        subprocess.run(["cargo", "build", "--release"], cwd=outer_dir, check=True)
-    
-    # Build and return path
-    return pyr0.build_guest(outer_dir, release=True)
+# Guest crates are committed at the repository root
+INNER_GUEST_DIR = Path("test_inner_guest")
+OUTER_GUEST_DIR = Path("test_outer_guest")
 
 def test_composition_with_composer():
     """Test composition using the Composer API."""
@@ -125,43 +26,38 @@ def test_composition_with_composer():
     
     try:
         
-        # Build both guests
+        # Build both guests; the outer build keeps running in the background
+        # while the inner proof is generated, since it only needs the outer ELF
         print("\n1. Building guests...")
-        inner_elf_path = build_inner_guest()
-        outer_elf_path = build_outer_guest()
-        
-        # Load images
-        print("\n2. Loading images...")
-        inner_elf = inner_elf_path.read_bytes()
-        outer_elf = outer_elf_path.read_bytes()
-        
-        inner_image = pyr0.load_image(inner_elf)
-        outer_image = pyr0.load_image(outer_elf)
-        
-        # Compute image IDs
-        inner_image_id_hex = pyr0.compute_image_id_hex(inner_elf)
-        inner_image_id_bytes = bytes.fromhex(inner_image_id_hex)
-        print(f"Inner image ID: {inner_image_id_hex[:16]}...")
-        print(f"Outer image ID: {pyr0.compute_image_id_hex(outer_elf)[:16]}...")
-        
-        # Create inner proof (must be succinct for composition)
-        print("\n3. Creating inner proof (3 + 5 = 8)...")
-        a, b = 3, 5
-        inner_input = pyr0.serialization.to_u32(a) + pyr0.serialization.to_u32(b)
-        inner_receipt = pyr0.prove_succinct(inner_image, inner_input)
-        
-        # Extract the sum from the journal
-        import struct
-        # The journal contains the serialized u32 sum (4 bytes, little-endian)
-        journal_bytes = inner_receipt.journal_bytes
-        sum_value = struct.unpack('<I', journal_bytes[:4])[0]
-        print(f"Inner proof created: sum = {sum_value}")
-        print(f"Inner proof size: {inner_receipt.seal_size} bytes")
-        print(f"Inner proof kind: {inner_receipt.kind}")
-        print(f"Is unconditional: {inner_receipt.is_unconditional}")
-        
-        # Create outer proof with assumption
-        print("\n4. Creating outer proof with assumption...")
+        with ThreadPoolExecutor(max_workers=1) as build_pool:
+            outer_build = build_pool.submit(pyr0.build_guest, OUTER_GUEST_DIR)
+            inner_elf_path = pyr0.build_guest(INNER_GUEST_DIR)
+            
+            # Load the inner image (its ID is computed while loading)
+            print("\n2. Loading inner image...")
+            inner_image = pyr0.load_image(inner_elf_path)
+            inner_image_id_bytes = inner_image.id
+            print(f"Inner image ID: {inner_image.id_hex[:16]}...")
+            
+            # Create inner proof (must be succinct for composition)
+            print("\n3. Creating inner proof (3 + 5 = 8)...")
+            a, b = 3, 5
+            inner_input = pyr0.serialization.to_u32(a) + pyr0.serialization.to_u32(b)
+            inner_receipt = pyr0.prove_succinct(inner_image, inner_input)
+            
+            # Extract the sum from the journal
+            # The journal contains the serialized u32 sum (4 bytes, little-endian)
+            journal_bytes = inner_receipt.journal_bytes
+            sum_value = int.from_bytes(journal_bytes[:4], 'little')
+            print(f"Inner proof created: sum = {sum_value}")
+            print(f"Inner proof size: {inner_receipt.seal_size} bytes")
+            print(f"Inner proof kind: {inner_receipt.kind}")
+            print(f"Is unconditional: {inner_receipt.is_unconditional}")
+            
+            # Create outer proof with assumption
+            print("\n4. Creating outer proof with assumption...")
+            outer_image = pyr0.load_image(outer_build.result())
+        print(f"Outer image ID: {outer_image.id_hex[:16]}...")
         
         # Create Composer with the inner receipt as an assumption
         comp = pyr0.Composer(outer_image)
@@ -171,16 +67,16 @@ def test_composition_with_composer():
         # The outer guest will verify the inner proof with the expected journal
         comp.expect_verification(inner_image_id_bytes, journal_bytes)
         
-        # Write inputs for the outer guest using typed writers
-        comp.write_u32(sum_value)  # Expected sum (4 bytes)
-        comp.write_image_id(inner_image_id_bytes)  # Inner image ID (32 bytes)
+        # Write inputs for the outer guest in one call:
+        # expected sum (u32, 4 bytes) and inner image ID (32 bytes)
+        comp.write_packed("I32s", sum_value, inner_image_id_bytes)
         
         # Prove with the assumption (defaults to succinct to resolve assumptions)
         outer_receipt = comp.prove()
         
         # Extract result from outer journal
         outer_journal = outer_receipt.journal_bytes
-        result = struct.unpack('<I', outer_journal[:4])[0]
+        result = int.from_bytes(outer_journal[:4], 'little')
         print(f"Outer proof created: result = {result} (sum * 2)")
         print(f"Outer proof size: {outer_receipt.seal_size} bytes")
         
@@ -208,8 +104,7 @@ def test_composition_with_composer():
             # Try to create outer proof with wrong expected sum
             comp_bad = pyr0.Composer(outer_image)
             comp_bad.assume(inner_receipt)
-            comp_bad.write_u32(999)  # Wrong sum!
-            comp_bad.write_image_id(inner_image_id_bytes)
+            comp_bad.write_packed("I32s", 999, inner_image_id_bytes)  # Wrong sum!
             
             outer_receipt_bad = comp_bad.prove()
             print("❌ Should have failed with wrong assumption!")
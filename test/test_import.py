@@ -10,9 +10,8 @@ for name in sorted(dir(pyr0)):
         print(f"  {name}")
 
 print("\nIn pyr0._rust module:")
-for name in sorted(dir(pyr0._rust)):
+for name, obj in sorted(vars(pyr0._rust).items()):
     if not name.startswith('_'):
-        obj = getattr(pyr0._rust, name)
         print(f"  {name}: {type(obj)}")
 
 # Try to import v0.7.0 classes
@@ -25,13 +25,14 @@ def test_input_builder_standalone():
         elf_path = pyr0.build_guest(guest_dir, "test-cbor-guest")
         print(f"   ✓ Built guest: {elf_path}")
         
-        with open(elf_path, "rb") as f:
-            elf_data = f.read()
-        
-        # Load the image
+        # Load the image straight from the ELF path
         print("\n2. Loading guest image...")
-        image = pyr0.load_image(elf_data)
+        image = pyr0.load_image_cached(elf_path)
         print(f"   ✓ Loaded image with ID: {image.id_hex[:16]}...")
+        if pyr0.load_image_cached(elf_path) is not image:
+            print(f"   ❌ Loading the same ELF again should reuse the cached Image")
+            return False
+        print(f"   ✓ Second load reused the cached Image")
         
         # Test 1: InputBuilder with CBOR
         print("\n3. Testing InputBuilder with CBOR...")
@@ -70,8 +71,8 @@ def test_input_builder_standalone():
         print("\n4. Testing method chaining...")
         builder2 = pyr0.InputBuilder()
         
-        # Chain multiple writes
-        builder2.write_u32(100).write_u64(200).write_raw_bytes(b"\x00" * 8)
+        # Chain multiple writes into one exactly-sized allocation
+        builder2.reserve(20).write_u32(100).write_u64(200).write_raw_bytes(b"\x00" * 8)
         
         chained_data = builder2.build()
         print(f"   ✓ Method chaining works: {len(chained_data)} bytes")
@@ -80,9 +81,7 @@ def test_input_builder_standalone():
         expected_size = 4 + 8 + 8  # u32 + u64 + 8 raw bytes
         if len(chained_data) == expected_size:
             # Parse to verify
-            u32_val = struct.unpack('<I', chained_data[0:4])[0]
-            u64_val = struct.unpack('<Q', chained_data[4:12])[0]
-            raw_bytes = chained_data[12:20]
+            u32_val, u64_val, raw_bytes = struct.unpack_from('<IQ8s', chained_data)
             
             if u32_val == 100 and u64_val == 200 and raw_bytes == b"\x00" * 8:
                 print(f"   ✓ Data correctly serialized")
@@ -120,6 +119,87 @@ def test_input_builder_standalone():
             print(f"   ❌ Builder not properly reusable")
             return False
         
+        # Test 4: Truncate back to a shared prefix
+        print("\n6. Testing truncate() prefix reuse...")
+        builder4 = pyr0.InputBuilder()
+        builder4.write_bytes32(b"\xaa" * 32)
+        prefix = builder4.size
+        
+        outputs = []
+        for value in (1, 2):
+            builder4.truncate(prefix).write_u32(value)
+            outputs.append(builder4.build())
+        
+        if outputs == [b"\xaa" * 32 + struct.pack('<I', v) for v in (1, 2)]:
+            print(f"   ✓ Prefix reused across builds")
+        else:
+            print(f"   ❌ Truncate produced wrong data")
+            return False
+        
+        try:
+            builder4.truncate(builder4.size + 1)
+            print(f"   ❌ Truncate past the end should raise ValueError")
+            return False
+        except ValueError:
+            print(f"   ✓ Truncate past the end rejected")
+        
+        # Test 5: Preallocated builder
+        print("\n7. Testing capacity and reserve()...")
+        builder5 = pyr0.InputBuilder(capacity=64)
+        if builder5.size != 0:
+            print(f"   ❌ Preallocated builder should start empty, size={builder5.size}")
+            return False
+        builder5.reserve(32)
+        builder5.write_u32(7).write_bytes32(b"\xbb" * 32)
+        if builder5.build() == struct.pack('<I', 7) + b"\xbb" * 32:
+            print(f"   ✓ Preallocated builder serializes normally")
+        else:
+            print(f"   ❌ Preallocated builder produced wrong data")
+            return False
+        
+        # Test 6: Several fields in one call
+        print("\n8. Testing write_packed()...")
+        packed = pyr0.InputBuilder().write_packed("I32sQ", 7, b"\xbb" * 32, 2**40).build()
+        chained = pyr0.InputBuilder().write_u32(7).write_bytes32(b"\xbb" * 32).write_u64(2**40).build()
+        if packed == chained:
+            print(f"   ✓ write_packed matches the chained writers")
+        else:
+            print(f"   ❌ write_packed produced different bytes")
+            return False
+        
+        builder6 = pyr0.InputBuilder().write_u32(1)
+        rejected = [
+            ("I32s", (2, b"short"), ValueError),
+            ("IQ", (2,), ValueError),
+            ("I", (2, 3), ValueError),
+            ("X", (2,), ValueError),
+            ("II", (2, -1), OverflowError),
+            ("I32s", (2, 5), TypeError),
+            ("9" * 30 + "s", (b"",), ValueError),
+        ]
+        for fmt, values, error in rejected:
+            try:
+                builder6.write_packed(fmt, *values)
+                print(f"   ❌ write_packed({fmt!r}) should have been rejected")
+                return False
+            except error:
+                pass
+        
+        # An invalid code is reported as such, even with no values to consume
+        try:
+            builder6.write_packed("X")
+            print(f"   ❌ write_packed('X') should have been rejected")
+            return False
+        except ValueError as e:
+            if "Invalid" not in str(e):
+                print(f"   ❌ write_packed('X') reported the wrong error: {e}")
+                return False
+        if builder6.size == 4:
+            print(f"   ✓ Rejected formats leave the builder unchanged")
+        else:
+            print(f"   ❌ Rejected write_packed left {builder6.size - 4} stray bytes")
+            return False
+        
         return True
         
     except Exception as e:
@@ -137,8 +217,7 @@ def test_input_builder_with_prove():
         # Build test guest
         print("\n1. Preparing test guest...")
         guest_dir = Path("test_cbor_guest")
-        elf_data = open(pyr0.build_guest(guest_dir), "rb").read()
-        image = pyr0.load_image(elf_data)
+        image = pyr0.load_image_cached(pyr0.build_guest(guest_dir))
         
         # Create input with InputBuilder (matching what guest expects)
         print("\n2. Creating input with InputBuilder...")
@@ -2,7 +2,6 @@
 """Test that PyR0 verification actually rejects invalid proofs."""
 
 import pyr0
-import os
 import sys
 import time
 
@@ -38,11 +37,10 @@ except Exception as e:
         try:
             elf_path = pyr0.build_guest(test_guest_dir, "ed25519-guest-input")
             print(f"   Found test ELF: {elf_path}")
-            with open(elf_path, "rb") as f:
-                elf_data = f.read()
             
+            # load_image reads the file itself, so timing covers the read too
             start_load = time.time()
-            image = pyr0.load_image(elf_data)
+            image = pyr0.load_image(elf_path)
             load_time = time.time() - start_load
             print(f"   ✓ Loaded test ELF in {load_time:.3f}s, image ID: {image.id.hex()[:16]}...")
             
@@ -55,7 +53,7 @@ except Exception as e:
             sig_bytes = b'\x00' * 64  # 64-byte signature
             msg_bytes = b''  # empty message
             
-            input_data = serialization.ed25519_input(pk_bytes, sig_bytes, msg_bytes)
+            input_data = serialization.ed25519_input_arrays(pk_bytes, sig_bytes, msg_bytes)
             
             print("   Starting proof generation...")
             start_prove = time.time()
@@ -9,7 +9,6 @@ Test the Receipt API improvements:
 """
 
 import sys
-import os
 from pathlib import Path
 
 def test_receipt_api():
@@ -29,15 +28,12 @@ def test_receipt_api():
         try:
             print("\nBuilding test guest program...")
             elf_path = pyr0.build_guest(GUEST_DIR, "ed25519-guest-input")
-            
-            with open(elf_path, "rb") as f:
-                elf_data = f.read()
         except (pyr0.GuestBuildFailedError, pyr0.ElfNotFoundError) as e:
             print(f"✗ Failed to build guest: {e}")
             return False
         
-        image = pyr0.load_image(elf_data)
-        trusted_image_id = image.id.hex()
+        image = pyr0.load_image(elf_path)
+        trusted_image_id = image.id_hex
         
         # Create a receipt
         print("\n1. Creating test receipt...")
@@ -48,7 +44,7 @@ def test_receipt_api():
         pk_bytes = bytes.fromhex(PUBLIC_KEY)
         sig_bytes = bytes.fromhex(VALID_SIG)
         msg_bytes = MESSAGE.encode('utf-8')
-        input_data = serialization.ed25519_input(pk_bytes, sig_bytes, msg_bytes)
+        input_data = serialization.ed25519_input_arrays(pk_bytes, sig_bytes, msg_bytes)
         
         receipt = pyr0.prove(image, input_data)
         print("   ✓ Receipt created")
@@ -230,7 +226,7 @@ def test_receipt_api():
         
         # verify_bytes
         try:
-            receipt.verify_bytes(bytes.fromhex(trusted_image_id))
+            receipt.verify_bytes(image.id)
             print("   ✓ verify_bytes succeeded")
         except Exception as e:
             print(f"   ✗ verify_bytes failed: {e}")
@@ -335,9 +331,10 @@ def test_receipt_api():
         else:
             print(f"   ✓ ExitStatus.__repr__: {exit_repr}")
         
-        # Test 10: compute_image_id_hex
+        # Test 10: compute_image_id_hex (an independent computation from the
+        # file, deliberately not reusing image.id)
         print("\n10. Testing compute_image_id_hex...")
-        computed_id = pyr0.compute_image_id_hex(elf_data)
+        computed_id = pyr0.compute_image_id_hex(elf_path)
         if not isinstance(computed_id, str) or len(computed_id) != 64:
             print(f"   ✗ compute_image_id_hex wrong format")
             test_passed = False
@@ -19,13 +19,11 @@ test_guest_dir = Path("demo/ed25519_demo_guest")
 try:
     print("1. Building and loading legitimate program...")
     elf_path = pyr0.build_guest(test_guest_dir, "ed25519-guest-input")
-    with open(elf_path, "rb") as f:
-        elf_data = f.read()
 except (pyr0.GuestBuildFailedError, pyr0.ElfNotFoundError) as e:
     print(f"❌ Could not build test ELF: {e}")
     sys.exit(1)
 
-image = pyr0.load_image(elf_data)
+image = pyr0.load_image(elf_path)
 trusted_image_id = image.id  # This is our trusted image ID
 print(f"   ✓ Loaded program with image ID: {trusted_image_id.hex()[:16]}...")
 
@@ -36,7 +34,7 @@ from pyr0 import serialization
 pk_bytes = b'\x00' * 32  
 sig_bytes = b'\x00' * 64  
 msg_bytes = b''
-input_data = serialization.ed25519_input(pk_bytes, sig_bytes, msg_bytes)
+input_data = serialization.ed25519_input_arrays(pk_bytes, sig_bytes, msg_bytes)
 
 receipt = pyr0.prove(image, input_data)
 print(f"   ✓ Generated receipt for our program")
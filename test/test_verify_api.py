@@ -1,19 +1,12 @@
 #!/usr/bin/env python3
 """Quick test to check if verify() requires image_id parameter."""
 
+import inspect
 import sys
-import importlib
-
-test_passed = True
-
-# Force reimport
-if 'pyr0' in sys.modules:
-    del sys.modules['pyr0']
-if 'pyr0._rust' in sys.modules:
-    del sys.modules['pyr0._rust']
 
 import pyr0
-import inspect
+
+test_passed = True
 
 print("Testing Receipt.verify() signature...")
 print(f"Signature: {inspect.signature(pyr0._rust.Receipt.verify)}")
@@ -24,15 +17,12 @@ from pathlib import Path
 test_guest_dir = Path("demo/ed25519_demo_guest")
 try:
     elf_path = pyr0.build_guest(test_guest_dir, "ed25519-guest-input")
-    with open(elf_path, "rb") as f:
-        elf_data = f.read()
-    
-    image = pyr0.load_image(elf_data)
+    image = pyr0.load_image(elf_path)
     print(f"Loaded image with ID: {image.id.hex()[:16]}...")
     
     # Create a simple proof
     from pyr0 import serialization
-    input_data = serialization.ed25519_input(b'\x00' * 32, b'\x00' * 64, b'')
+    input_data = serialization.ed25519_input_arrays(b'\x00' * 32, b'\x00' * 64, b'')
     
     print("Generating proof...")
     receipt = pyr0.prove(image, input_data)
@@ -70,6 +60,33 @@ try:
     except Exception as e:
         print(f"  ❌ verify(Image) failed: {e}")
         test_passed = False
+    
+    # A receipt that already verified must still reject a different ID
+    try:
+        receipt.verify(b'\x00' * 32)
+        print("  ❌ verify() accepted a wrong image ID after a successful verify - SECURITY ISSUE!")
+        test_passed = False
+    except RuntimeError:
+        print("  ✓ Wrong image ID rejected after a successful verify")
+    
+    print("\nTrying verify_batch...")
+    try:
+        pyr0.verify_batch([(receipt, image), (receipt, image.id), (receipt, image.id_hex)])
+        print("  ✓ verify_batch accepted matching receipts")
+    except Exception as e:
+        print(f"  ❌ verify_batch failed: {e}")
+        test_passed = False
+    
+    try:
+        pyr0.verify_batch([(receipt, image), (receipt, b'\x00' * 32)])
+        print("  ❌ verify_batch accepted a wrong image ID - SECURITY ISSUE!")
+        test_passed = False
+    except RuntimeError as e:
+        if "receipt 1" in str(e):
+            print(f"  ✓ verify_batch rejected the wrong image ID at index 1")
+        else:
+            print(f"  ❌ verify_batch reported the wrong index: {e}")
+            test_passed = False
 except (pyr0.GuestBuildFailedError, pyr0.ElfNotFoundError) as e:
     print(f"❌ Could not build test ELF: {e}")
     test_passed = False